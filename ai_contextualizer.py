@@ -14,15 +14,15 @@ except:
     pass
 
 class ContentGenerator:
-    def __init__(self):
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """Initialize the content generator with OpenAI client"""
-        # Try to get API key from multiple sources
-        api_key = self._get_api_key()
+        # Use the given key/model, otherwise look them up from multiple sources
+        api_key = api_key or self._get_api_key()
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found. Please set it in Snowflake secrets or environment variables.")
         
         self.client = openai.OpenAI(api_key=api_key)
-        self.model = self._get_model()
+        self.model = model or self._get_model()
         
         # Content templates for different angles
         self.angle_templates = {
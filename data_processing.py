@@ -69,7 +69,8 @@ class SnowflakeConnector:
     
     def execute_query(self, query: str) -> pd.DataFrame:
         """Execute a query and return results as DataFrame"""
-        if not self.conn:
+        # Reopen a dropped connector connection rather than failing every query
+        if not self.conn or (self.is_local and self.conn.is_closed()):
             if not self.connect():
                 raise Exception("Cannot establish Snowflake connection")
         
@@ -167,6 +168,7 @@ class SnowflakeConnector:
         if self.conn and self.is_local:
             # Only close connector connections, not Snowpark sessions
             self.conn.close()
+            self.conn = None
             print("🔌 Snowflake connection closed")
         elif not self.is_local:
             print("🔌 Snowpark session remains active")
@@ -283,9 +283,10 @@ class SocialContentPipeline:
             angles.append('notable_performance')
         
         # International appeal angle
-        if event_data.get('international_pct', 0) > 40:
+        international_pct = event_data.get('international_pct', 0)
+        if international_pct > 40:
             angles.append('international_phenomenon')
-        elif event_data.get('international_pct', 0) > 25:
+        elif international_pct > 25:
             angles.append('international_appeal')
         
         # Market leadership angle
@@ -303,8 +304,9 @@ class SocialContentPipeline:
             angles.append('demand_indicator')
         
         # Tour context angle
-        if event_data.get('tour_context', {}).get('tour_name'):
-            tour_multiple = event_data.get('tour_context', {}).get('vs_tour_avg_multiple', 0)
+        tour_context = event_data.get('tour_context', {})
+        if tour_context.get('tour_name'):
+            tour_multiple = tour_context.get('vs_tour_avg_multiple', 0)
             if tour_multiple > 1.5:
                 angles.append('tour_standout')
         
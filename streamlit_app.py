@@ -1,10 +1,24 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
+import altair as alt
+import heapq
+import html
 import json
+import math
 import os
+import re
+import string
 import sys
+import time
+import traceback
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional
+from openai import OpenAI
 
 # Add project root to path for imports
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -12,7 +26,6 @@ sys.path.append(project_root)
 
 # Import social content pipeline components
 from social_content_generator import SocialContentPipeline
-from data_processing import SnowflakeConnector
 from ai_contextualizer import ContentGenerator
 from batch_processor import BatchProcessor
 
@@ -24,9 +37,184 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def load_custom_css():
-    """Load custom CSS styling"""
-    st.markdown("""
+# Content generation concurrency (OpenAI calls are I/O bound)
+GENERATION_MAX_WORKERS = 8
+GENERATION_MAX_RETRIES = 3
+GENERATION_RETRY_DELAY_SECONDS = 2
+DISPLAY_REFRESH_INTERVAL_SECONDS = 0.5
+
+# Content viewer items rendered per page
+CONTENT_PAGE_SIZE = 20
+CONTENT_FILTER_MIN_ITEMS = 2
+EXPORT_WRITE_BUFFER_BYTES = 1 << 20
+CONTENT_DIR = "data/generated_content"
+EXPORT_TIMESTAMP_PLACEHOLDER = "__EXPORTED_AT__"
+
+# Connection test results are reused for this long across reruns
+CONNECTION_PROBE_TTL_SECONDS = 60
+
+# Prompt templates for the editor (copied from ai_contextualizer.py)
+PROMPT_TEMPLATES = {
+    'major_spike': {
+        'name': '🚀 Major Spike (5x+ Career Average)',
+        'template': """Create viral {platform} content about this MASSIVE performance spike. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: Performing {career_multiple:.1f}x above career average - this is HUGE
+SUPPORTING DATA: {intl_pct:.0f}% international buyers, #{rank} trending this week
+{fandom_context}"""
+    },
+    'significant_spike': {
+        'name': '📈 Significant Spike (3-5x Career Average)', 
+        'template': """Create viral {platform} content about this SIGNIFICANT performance spike. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: Performing {career_multiple:.1f}x above career average - this is significant
+SUPPORTING DATA: {intl_pct:.0f}% international buyers, #{rank} trending this week
+{fandom_context}"""
+    },
+    'genre_leader': {
+        'name': '👑 Genre Leader',
+        'template': """Create viral {platform} content celebrating this genre-leading performance. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: #{genre_rank} in {genre} this year, #{overall_rank} overall
+SUPPORTING DATA: Genre-leading performance, top tier positioning
+{fandom_context}"""
+    },
+    'tour_standout': {
+        'name': '🔥 Tour Standout',
+        'template': """Create viral {platform} content about this standout tour performance. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: {tour_multiple:.1f}x above tour average for {tour_name}
+SUPPORTING DATA: Standout performance in tour, exceptional demand
+{fandom_context}"""
+    },
+    'international_phenomenon': {
+        'name': '🌍 International Phenomenon',
+        'template': """Create viral {platform} content about this international phenomenon. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}  
+KEY INSIGHT: {intl_pct:.0f}% international buyers - incredible global appeal
+SUPPORTING DATA: Worldwide demand, cross-cultural appeal
+{fandom_context}"""
+    },
+    'top_performer': {
+        'name': '🏆 Top Performer',
+        'template': """Create viral {platform} content about this top-tier performance. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: #{rank} performer this week, consistent excellence
+SUPPORTING DATA: Top-tier positioning, strong market performance
+{fandom_context}"""
+    },
+    'trending_event': {
+        'name': '📈 Trending Event (Default)',
+        'template': """Create viral {platform} content about this trending event. Remember: NO dollar amounts!
+EVENT: {artist} - {event_name} in {location}
+KEY INSIGHT: Trending #{rank} this week, strong performance
+SUPPORTING DATA: Market momentum, fan engagement
+{fandom_context}"""
+    }
+}
+
+# Templates pre-parsed into (literal, field, format_spec, conversion) tuples
+PARSED_PROMPT_TEMPLATES = {
+    name: list(string.Formatter().parse(config['template']))
+    for name, config in PROMPT_TEMPLATES.items()
+}
+
+# System prompt shown in the prompt editor
+SYSTEM_PROMPT = """You are a Gen Z social media expert creating viral content for live events and entertainment. 
+Your content should be data-driven but never boring, optimized for discovery, and designed to make people stop scrolling.
+
+CRITICAL RULES:
+1. NEVER share actual dollar amounts or GMS numbers - use relative terms like "massive surge" or "top performer"
+2. Always provide TWO separate outputs: VISUAL TEXT and CAPTION
+3. Write like Gen Z (but not cringe) - authentic, direct, no millennial energy
+4. Front-load artist/team names for SEO and discovery
+
+For Instagram/TikTok:
+- VISUAL TEXT: Punchy, data-forward, shareable. Think billboard text - immediate impact, no context needed
+- CAPTION: Keyword-optimized, artist name first, context for fans, discovery-friendly hashtags
+- Make it something fans want to repost to their Stories with their own reaction"""
+
+# The prompt preview shows at most this many system prompt characters
+SYSTEM_PROMPT_PREVIEW_CHARS = 500
+SYSTEM_PROMPT_PREVIEW = (
+    SYSTEM_PROMPT if len(SYSTEM_PROMPT) <= SYSTEM_PROMPT_PREVIEW_CHARS
+    else f"{SYSTEM_PROMPT[:SYSTEM_PROMPT_PREVIEW_CHARS]}..."
+)
+
+# Content angle -> (condition on career multiple/rank/GMS, preview template)
+CONTENT_PREVIEWS = {
+    'significant_spike': (
+        lambda career_multiple, rank, gms: career_multiple >= 3,
+        "🔥 {artist} is ON FIRE in {city}! Performing at {career_multiple:.1f}x above their career average..."
+    ),
+    'genre_leader': (
+        lambda career_multiple, rank, gms: rank <= 5,
+        "👑 {artist} is CRUSHING it at #{rank} this week! Dominating the charts..."
+    ),
+    'tour_standout': (
+        lambda career_multiple, rank, gms: bool(gms),
+        "🎪 {artist}'s {city} show is breaking records with ${gms:,.0f} in sales..."
+    ),
+    'top_performer': (
+        lambda career_multiple, rank, gms: True,
+        "⭐ {artist} continues their incredible run with another standout performance..."
+    ),
+    'international_appeal': (
+        lambda career_multiple, rank, gms: True,
+        "🌍 {artist} is capturing hearts worldwide with their {city} show..."
+    )
+}
+DEFAULT_CONTENT_PREVIEW = (
+    lambda career_multiple, rank, gms: True,
+    "📈 {artist} is trending with their latest performance in {city}..."
+)
+
+# Content angle -> priority points added on top of the 0-5 quality points
+ANGLE_PRIORITY_SCORES = {
+    'major_spike': 5,
+    'significant_spike': 4,
+    'genre_leader': 4,
+    'international_phenomenon': 4,
+    'tour_standout': 3,
+    'top_performer': 3,
+    'international_appeal': 2,
+    'pricing_surge': 2,
+    'notable_performance': 2,
+    'demand_indicator': 1,
+    'top_performance': 1,
+    'trending_event': 1
+}
+
+# Required event fields copied onto every generated content item
+CONTENT_EVENT_FIELDS = itemgetter('event_id', 'event_name', 'data_completeness')
+
+# Placeholder values treated as a missing classified artist name
+INVALID_ARTIST_NAMES = frozenset({'Unknown', 'None', None, 'nan', ''})
+
+# Genre keyword -> (priority, fandom context); lower priority wins when a
+# genre mentions several keywords (e.g. "pop rock" reads as rock)
+FANDOM_CONTEXTS = {
+    'hip hop': (0, "Consider adding hip-hop culture references if relevant"),
+    'rap': (0, "Consider adding hip-hop culture references if relevant"),
+    'rock': (1, "Consider rock/metal culture references if relevant"),
+    'country': (2, "Consider country music culture references if relevant"),
+    'pop': (3, "Consider pop culture references if relevant"),
+    'sports': (4, "Consider sports culture and team loyalty references if relevant")
+}
+FANDOM_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in FANDOM_CONTEXTS))
+
+# Generated content and export filenames, e.g. social_content_20250101_120000.json
+# or social_content_export_20250101_120000.csv
+CONTENT_FILE_RE = re.compile(r'^social_content_(?P<export>export_)?(?P<timestamp>\d{8}_\d{6})\.(?P<ext>json|csv|txt)$')
+EXPORT_MIME_TYPES = {
+    '.json': "application/json",
+    '.csv': "text/csv",
+    '.txt': "text/plain"
+}
+
+# Custom CSS is static, so build the markup once at import time instead of
+# re-evaluating the literal on every rerun
+_CUSTOM_CSS = """
     <style>
         .main-header {
             background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -77,8 +265,368 @@ def load_custom_css():
             text-align: center;
             border: 1px solid #e0e7ff;
         }
+        
+        .visual-text-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 15px;
+            border-radius: 8px;
+            font-weight: bold;
+            text-align: center;
+        }
+        
+        .visual-text-card.large {
+            padding: 20px;
+            border-radius: 10px;
+            font-size: 18px;
+            margin: 10px 0;
+        }
+        
+        .caption-card {
+            background: #f8f9ff;
+            border: 1px solid #e0e7ff;
+            padding: 15px;
+            border-radius: 8px;
+            font-style: italic;
+        }
+        
+        .caption-card.spaced {
+            margin: 10px 0;
+        }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+# Copy buttons render inside their own iframe, which _CUSTOM_CSS can't reach
+_COPY_BUTTONS_CSS = """
+    <style>
+        .copy-button {
+            font-family: sans-serif;
+            padding: 0.25rem 0.75rem;
+            margin-right: 0.5rem;
+            border-radius: 0.5rem;
+            border: 1px solid #ccc;
+            background: #fff;
+            cursor: pointer;
+        }
+    </style>
+"""
+
+def load_custom_css():
+    """Load custom CSS styling"""
+    # Streamlit drops any element that is not re-emitted during a rerun, so
+    # the style block is injected every run; only the string is precomputed
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+def format_parsed_template(parsed_template, data):
+    """Render a template from PARSED_PROMPT_TEMPLATES without re-tokenizing it"""
+    return "".join(
+        literal + (format(data[field_name], format_spec) if field_name is not None else "")
+        for literal, field_name, format_spec, _ in parsed_template
+    )
+
+def resolve_artist_name(event, default='Unknown'):
+    """Prefer the classified artist name, falling back to the category name"""
+    artist_name = event.get('classified_artist_name', event.get('artist_name', default))
+    if artist_name in INVALID_ARTIST_NAMES:
+        artist_name = event.get('artist_name', default)
+    return artist_name
+
+_MISSING = object()
+
+def get_nested(data, path, default=None):
+    """Read a nested dict value like chained .get(key, default) calls; a present None is returned as-is"""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return default
+    return data
+
+@lru_cache(maxsize=1024)
+def format_timestamp(iso_timestamp, fmt, fallback):
+    """Format an ISO timestamp, parsing each distinct value only once"""
+    try:
+        return datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00')).strftime(fmt)
+    except (AttributeError, TypeError, ValueError):
+        return fallback
+
+def get_setting(name, default=None):
+    """Read a setting from the environment, falling back to Streamlit secrets"""
+    value = os.getenv(name)
+    if value:
+        return value
+    try:
+        if name in st.secrets:
+            return st.secrets[name]
+    except Exception:
+        pass
+    return default
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key):
+    """Share one OpenAI client (and its connection pool) per API key"""
+    return OpenAI(api_key=api_key)
+
+@st.cache_resource(show_spinner=False)
+def get_content_generator(api_key, model):
+    """Share one ContentGenerator per API key and model across reruns"""
+    return ContentGenerator(api_key=api_key, model=model)
+
+def send_openai_probe(api_key, model):
+    """Send a tiny completion to OpenAI and return its reply"""
+    response = get_openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": "Say 'test successful'"}],
+        max_tokens=10
+    )
+    return response.choices[0].message.content.strip()
+
+@st.cache_data(ttl=CONNECTION_PROBE_TTL_SECONDS, show_spinner=False)
+def probe_openai(api_key, model):
+    """Cached OpenAI probe; failures raise so they are never cached"""
+    return send_openai_probe(api_key, model)
+
+@st.cache_data(ttl=CONNECTION_PROBE_TTL_SECONDS, show_spinner=False)
+def probe_snowflake(_connector, is_local):
+    """Run the Snowflake test query; failures raise so they are never cached"""
+    if not _connector.test_connection():
+        raise ConnectionError("Connection test failed")
+    return True
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline():
+    """Share one pipeline (and its Snowflake connection) across reruns and sessions.
+
+    Every session uses the same connector concurrently, so nothing here may
+    close its connection; queries reopen it themselves if it has dropped.
+    """
+    return SocialContentPipeline()
+
+@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+def fetch_top_events_data(_pipeline, is_local):
+    """Query all 4 Snowflake views; failures raise so they are never cached"""
+    connector = _pipeline.snowflake_connector
+    
+    # Reuse the shared connection when there is one; it is never closed here
+    # because other sessions may be querying through it
+    if not connector.conn and not connector.connect():
+        raise ConnectionError("Failed to connect to Snowflake")
+    
+    # Query all views
+    dataframes = _pipeline.query_top_events_views()
+    
+    if dataframes['base_events'].empty:
+        raise ValueError("No data returned from Snowflake views. Please check your connection and view permissions.")
+    
+    return dataframes
+
+@st.cache_data(ttl=300, show_spinner=False)
+def structure_events_cached(_pipeline, dataframes):
+    """Structure loaded view data into events once per distinct data load"""
+    return _pipeline.structure_event_data(dataframes)
+
+def clear_connection_probes():
+    """Forget cached connection test results"""
+    probe_openai.clear()
+    probe_snowflake.clear()
+
+def summarize_content(content_data):
+    """Compute content summary metrics with vectorized pandas ops over one frame"""
+    if not content_data:
+        return {
+            'unique_events': 0,
+            'unique_artists': 0,
+            'content_angles': [],
+            'platforms': [],
+            'average_quality_score': 0
+        }
+    
+    content_df = pd.DataFrame(
+        content_data,
+        columns=['event_id', 'artist_name', 'content_angle', 'platform', 'data_quality_score']
+    )
+    return {
+        'unique_events': int(content_df['event_id'].nunique(dropna=False)),
+        'unique_artists': int(content_df['artist_name'].nunique(dropna=False)),
+        'content_angles': content_df['content_angle'].fillna('').unique().tolist(),
+        'platforms': content_df['platform'].fillna('').unique().tolist(),
+        'average_quality_score': float(content_df['data_quality_score'].fillna(0).mean())
+    }
+
+def calculate_priority_scores(content_data):
+    """Vectorized calculate_priority_score for a list of content items"""
+    content_df = pd.DataFrame(content_data, columns=['content_angle', 'data_quality_score'])
+    base_scores = content_df['data_quality_score'].fillna(0) * 5
+    angle_scores = content_df['content_angle'].map(ANGLE_PRIORITY_SCORES).fillna(1)
+    return (base_scores + angle_scores).astype(int).clip(upper=10).tolist()
+
+@lru_cache(maxsize=None)
+def format_angle_name(angle):
+    """Turn a content angle id like 'genre_leader' into 'Genre Leader'"""
+    return angle.replace('_', ' ').title()
+
+@lru_cache(maxsize=64)
+def build_session_status(event_count, selected_count, content_count, last_error):
+    """Build the sidebar status lines as (alert kind, message) pairs for a session fingerprint"""
+    lines = []
+    
+    # Data status
+    if event_count is not None:
+        lines.append(('success', f"✅ Data: {event_count} events"))
+    else:
+        lines.append(('warning', "⚠️ No data loaded"))
+    
+    # Selection status
+    if selected_count:
+        lines.append(('info', f"🎯 Selected: {selected_count} events"))
+    
+    # Content status
+    if content_count is not None:
+        lines.append(('success', f"✅ Content: {content_count} pieces"))
+    
+    # Error status
+    if last_error:
+        lines.append(('error', f"❌ Last error: {last_error[:50]}..."))
+    
+    return tuple(lines)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def read_file_bytes(path, mtime):
+    """Read a file once per modification time for download buttons"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+@st.cache_data(ttl=5, show_spinner=False)
+def list_recent_content_files(directory, limit=5):
+    """List the newest JSON files by name without sorting the whole directory"""
+    try:
+        with os.scandir(directory) as entries:
+            return heapq.nlargest(
+                limit,
+                (entry.name for entry in entries if entry.name.endswith('.json') and entry.is_file())
+            )
+    except FileNotFoundError:
+        return []
+
+@st.cache_data(ttl=30, show_spinner=False)
+def scan_content_files(directory, dir_mtime_ns):
+    """Map each file in a directory to its (size, mtime) in one scandir pass"""
+    files = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = (stat.st_size, stat.st_mtime)
+    return files
+
+def scan_content_dir():
+    """Scan CONTENT_DIR with one stat for the cache key; None if it doesn't exist"""
+    try:
+        dir_mtime_ns = os.stat(CONTENT_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return scan_content_files(CONTENT_DIR, dir_mtime_ns)
+
+def write_export_file(data, filename, directory=CONTENT_DIR):
+    """Write an export payload with one buffered write; returns (path, size in bytes)"""
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, filename)
+    
+    # Encode once and report the size from the same bytes
+    payload = data.encode('utf-8')
+    with open(file_path, 'wb', buffering=EXPORT_WRITE_BUFFER_BYTES) as f:
+        f.write(payload)
+    return file_path, len(payload)
+
+def render_copy_buttons(buttons):
+    """Copy text to the clipboard in the browser without a rerun; one iframe holds all of a card's (label, text) buttons"""
+    # Texts go in a script block, so '</' is escaped to keep them from closing it
+    texts = json.dumps([text for _, text in buttons]).replace('</', '<\\/')
+    markup = ''.join(
+        f'<button class="copy-button" data-index="{index}">{html.escape(label)}</button>'
+        for index, (label, _) in enumerate(buttons)
+    )
+    components.html(
+        f"""{_COPY_BUTTONS_CSS}{markup}
+        <script>
+            const texts = {texts};
+            document.querySelectorAll('.copy-button').forEach(button => {{
+                button.onclick = () => navigator.clipboard.writeText(texts[button.dataset.index])
+                    .then(() => button.innerText = '✅ Copied');
+            }});
+        </script>""",
+        height=40
+    )
+
+def get_fandom_context(genre):
+    """Get the prompt fandom hint for a genre in a single regex pass"""
+    matches = [FANDOM_CONTEXTS[keyword] for keyword in FANDOM_KEYWORD_RE.findall(genre.lower())]
+    return min(matches)[1] if matches else ""
+
+def content_angle_signature(event):
+    """Collect the event fields identify_content_angles reads, as a hashable tuple"""
+    tour_context = event.get('tour_context', {})
+    return (
+        event.get('career_context', {}).get('vs_career_avg_multiple'),
+        event.get('international_pct'),
+        event.get('market_position', {}).get('ytd_genre_rank'),
+        event.get('trend_insights', {}).get('price_appreciation_pct'),
+        tour_context.get('tour_name'),
+        tour_context.get('vs_tour_avg_multiple'),
+        event.get('rank')
+    )
+
+@st.cache_data(show_spinner=False)
+def cached_content_angles(_pipeline, _event, event_id, signature):
+    """Cache content angles per event id and angle-relevant fields"""
+    return _pipeline.identify_content_angles(_event)
+
+@st.cache_data(show_spinner=False)
+def build_genre_chart_spec(genres, counts):
+    """Build and cache the genre distribution bar chart spec"""
+    chart_df = pd.DataFrame({'Genre': genres, 'Count': counts})
+    # sort=None keeps the genres in the order they were passed in
+    chart = alt.Chart(chart_df).mark_bar().encode(
+        x=alt.X('Genre:N', sort=None),
+        y=alt.Y('Count:Q')
+    )
+    return chart.to_dict()
+
+def build_event_insights(events):
+    """Build the key insight lines for each event using vectorized masks"""
+    if not events:
+        return []
+    
+    metrics = pd.DataFrame({
+        'rank': [event.get('rank') for event in events],
+        'career_multiple': [event.get('career_context', {}).get('vs_career_avg_multiple', 0) for event in events],
+        'intl_pct': [event.get('international_pct', 0) for event in events],
+        'genre_rank': [event.get('market_position', {}).get('ytd_genre_rank') for event in events],
+        'genre': [event.get('genre', 'genre') for event in events]
+    })
+    rank = pd.to_numeric(metrics['rank'], errors='coerce').astype('Int64')
+    career_multiple = pd.to_numeric(metrics['career_multiple'], errors='coerce')
+    intl_pct = pd.to_numeric(metrics['intl_pct'], errors='coerce')
+    genre_rank = pd.to_numeric(metrics['genre_rank'], errors='coerce').astype('Int64')
+    
+    # Rank insight
+    top_rank = ("🏆 Top " + rank.astype(str) + " performer").where((rank != 0) & (rank <= 5))
+    
+    # Career performance
+    career_text = career_multiple.map("{:.1f}x above career average".format)
+    career = ("🚀 " + career_text).where(career_multiple >= 3, ("📈 " + career_text).where(career_multiple >= 2))
+    
+    # International appeal
+    international = intl_pct.map("🌍 {:.0f}% international buyers".format).where(intl_pct > 30)
+    
+    # Genre positioning
+    genre_position = ("🎭 #" + genre_rank.astype(str) + " in " + metrics['genre'].astype(str)).where((genre_rank != 0) & (genre_rank <= 10))
+    
+    return [
+        [insight for insight in row if isinstance(insight, str)]
+        for row in zip(top_rank, career, international, genre_position)
+    ]
 
 class SocialContentApp:
     def __init__(self):
@@ -120,8 +668,8 @@ class SocialContentApp:
         """Initialize pipeline components with proper error handling"""
         try:
             with st.spinner("🔧 Initializing components..."):
-                self.pipeline = SocialContentPipeline()
-                self.snowflake_connector = SnowflakeConnector()
+                self.pipeline = get_pipeline()
+                self.snowflake_connector = self.pipeline.snowflake_connector
             st.session_state.last_error = None
         except ImportError as e:
             error_msg = f"Missing dependencies: {str(e)}. Please check your environment setup."
@@ -132,6 +680,10 @@ class SocialContentApp:
             st.error(f"❌ {error_msg}")
             st.session_state.last_error = error_msg
     
+    def get_content_angles(self, event):
+        """Get content angles for an event, memoized across reruns"""
+        return cached_content_angles(self.pipeline, event, event.get('event_id'), content_angle_signature(event))
+    
     def reset_app_state(self):
         """Reset all session state to start over"""
         keys_to_clear = [
@@ -148,20 +700,10 @@ class SocialContentApp:
         st.success("✅ Application reset successfully! All data cleared.")
         st.experimental_rerun()
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def load_snowflake_data(_self):
-        """Load and cache data from all 4 Snowflake views"""
+    def load_snowflake_data(self):
+        """Load data from all 4 Snowflake views, cached for 5 minutes"""
         try:
-            # Connect to Snowflake
-            if not _self.snowflake_connector.connect():
-                raise Exception("Failed to connect to Snowflake")
-            
-            # Query all views
-            dataframes = _self.pipeline.query_top_events_views()
-            
-            # Close connection
-            _self.snowflake_connector.close_connection()
-            
+            dataframes = fetch_top_events_data(self.pipeline, self.snowflake_connector.is_local)
             return dataframes, None
             
         except Exception as e:
@@ -209,54 +751,73 @@ class SocialContentApp:
         # Load data if button clicked, auto-refresh enabled, or no data exists
         should_load = (load_data or auto_refresh or not st.session_state.data_loaded)
         
+        # Visual buffer: paint the last successful load straight away so the
+        # summary stays on screen while Snowflake is queried again
+        last_good_data = st.session_state.snowflake_data if st.session_state.data_loaded else {}
+        summary_placeholder = st.empty()
+        
+        if should_load and last_good_data:
+            with summary_placeholder.container():
+                st.info("⏳ Showing last loaded data while refreshing from Snowflake...")
+                try:
+                    self.render_data_summary(last_good_data)
+                except Exception as e:
+                    st.warning(f"⚠️ Could not display data summary: {str(e)}")
+        
         if should_load:
+            load_error = None
+            
             try:
                 with st.spinner("🔍 Connecting to Snowflake and querying views..."):
                     dataframes, error = self.load_snowflake_data()
                     
                     if error:
-                        st.error(f"❌ Failed to load data: {error}")
-                        st.session_state.last_error = error
-                        st.session_state.data_loaded = False
-                        return None
-                    
-                    if not dataframes or dataframes.get('base_events') is None or dataframes['base_events'].empty:
-                        error_msg = "No data returned from Snowflake views. Please check your connection and view permissions."
-                        st.error(f"❌ {error_msg}")
-                        st.session_state.last_error = error_msg
-                        st.session_state.data_loaded = False
-                        return None
-                    
-                    # Store in session state
-                    st.session_state.snowflake_data = dataframes
-                    st.session_state.data_loaded = True
-                    st.session_state.last_error = None
-                    st.session_state.current_step = 'select_events'
-                    
-                    # Structure the events
-                    with st.spinner("🔗 Structuring event data..."):
-                        structured_events = self.pipeline.structure_event_data(dataframes)
-                        st.session_state.structured_events = structured_events
+                        load_error = f"Failed to load data: {error}"
+                    elif not dataframes or dataframes.get('base_events') is None or dataframes['base_events'].empty:
+                        load_error = "No data returned from Snowflake views. Please check your connection and view permissions."
+                    else:
+                        # Store in session state
+                        st.session_state.snowflake_data = dataframes
+                        st.session_state.data_loaded = True
+                        st.session_state.last_error = None
+                        st.session_state.current_step = 'select_events'
+                        
+                        # Structure the events
+                        with st.spinner("🔗 Structuring event data..."):
+                            structured_events = structure_events_cached(self.pipeline, dataframes)
+                            st.session_state.structured_events = structured_events
+                        
+                        if last_good_data:
+                            st.toast("✅ Data refreshed")
                         
             except Exception as e:
-                error_msg = f"Unexpected error during data loading: {str(e)}"
-                st.error(f"❌ {error_msg}")
-                st.session_state.last_error = error_msg
-                st.session_state.data_loaded = False
-                return None
+                load_error = f"Unexpected error during data loading: {str(e)}"
+            
+            if load_error:
+                st.error(f"❌ {load_error}")
+                st.session_state.last_error = load_error
+                
+                if not last_good_data:
+                    st.session_state.data_loaded = False
+                    summary_placeholder.empty()
+                    return None
+                
+                st.warning("⚠️ Refresh failed. Showing the last successfully loaded data.")
         
         # Display loaded data summary if available
         if st.session_state.data_loaded and st.session_state.snowflake_data:
             dataframes = st.session_state.snowflake_data
             
-            # Success message
-            st.success(f"✅ Successfully loaded {len(st.session_state.structured_events)} events from Snowflake!")
-            
-            # Summary metrics
-            try:
-                self.render_data_summary(dataframes)
-            except Exception as e:
-                st.warning(f"⚠️ Could not display data summary: {str(e)}")
+            # Swap the buffered summary for the current data
+            with summary_placeholder.container():
+                # Success message
+                st.success(f"✅ Successfully loaded {len(st.session_state.structured_events)} events from Snowflake!")
+                
+                # Summary metrics
+                try:
+                    self.render_data_summary(dataframes)
+                except Exception as e:
+                    st.warning(f"⚠️ Could not display data summary: {str(e)}")
             
             # Expandable dataframes
             try:
@@ -303,20 +864,10 @@ class SocialContentApp:
                 st.metric("Top Genre", "N/A")
         
         with col4:
-            # Average rank
-            if 'RECENT_GMS_RANK' in base_events.columns:
-                try:
-                    # Convert to numeric and calculate mean
-                    rank_numeric = pd.to_numeric(base_events['RECENT_GMS_RANK'], errors='coerce')
-                    avg_rank = rank_numeric.mean()
-                    if pd.notna(avg_rank):
-                        st.metric("Avg Rank", f"#{avg_rank:.1f}")
-                    else:
-                        st.metric("Avg Rank", "N/A")
-                except:
-                    st.metric("Avg Rank", "N/A")
-            else:
-                st.metric("Avg Rank", "N/A")
+            # Average rank (coerce turns bad values into NaN, so no try needed)
+            rank_column = base_events.get('RECENT_GMS_RANK')
+            avg_rank = pd.to_numeric(rank_column, errors='coerce').mean() if rank_column is not None else None
+            st.metric("Avg Rank", f"#{avg_rank:.1f}" if pd.notna(avg_rank) else "N/A")
         
         # Top artists/events
         st.markdown("### 🏆 Top Performers")
@@ -348,7 +899,7 @@ class SocialContentApp:
                 else:
                     st.warning("⚠️ No valid GMS data available for top performers")
                     
-            except Exception as e:
+            except (KeyError, ValueError, TypeError) as e:
                 st.warning(f"⚠️ Could not display top performers: {str(e)}")
                 # Show basic info without sorting
                 if len(base_events) > 0:
@@ -367,8 +918,12 @@ class SocialContentApp:
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                # Create a simple bar chart
-                st.bar_chart(genre_counts)
+                # Chart spec is cached on the counts, so reruns skip rebuilding it
+                chart_spec = build_genre_chart_spec(
+                    tuple(genre_counts.index.astype(str)),
+                    tuple(genre_counts.values.tolist())
+                )
+                st.vega_lite_chart(spec=chart_spec, use_container_width=True)
             
             with col2:
                 # Show as table
@@ -405,18 +960,15 @@ class SocialContentApp:
             if not df.empty:
                 with st.expander(f"📊 {view_name.replace('_', ' ').title()} ({len(df)} rows)", expanded=False):
                     
-                    # Show column info
-                    col1, col2 = st.columns([1, 2])
-                    
-                    with col1:
-                        st.markdown("**Columns:**")
-                        for col in df.columns:
-                            st.text(f"• {col}")
-                    
-                    with col2:
-                        st.markdown("**Data Types:**")
-                        for col, dtype in df.dtypes.items():
-                            st.text(f"• {col}: {dtype}")
+                    # Show column info, one markdown block per list
+                    with st.container():
+                        col1, col2 = st.columns([1, 2])
+                        
+                        with col1:
+                            st.markdown("**Columns:**\n\n" + "\n".join(f"- `{col}`" for col in df.columns))
+                        
+                        with col2:
+                            st.markdown("**Data Types:**\n\n" + "\n".join(f"- `{col}`: `{dtype}`" for col, dtype in df.dtypes.items()))
                     
                     st.markdown("**Sample Data:**")
                     
@@ -479,28 +1031,22 @@ class SocialContentApp:
             return []
         
         try:
-            # Create event options for selection
-            event_options = []
-            event_lookup = {}
-            
-            for event in events_data:
-                try:
-                    # Use event_category_name if classified_artist_name is null/None
-                    artist_name = event.get('classified_artist_name', 'Unknown')
-                    if artist_name in ['Unknown', 'None', None, 'nan', '']:
-                        artist_name = event.get('artist_name', 'Unknown')
-                    
-                    # Create display label with error handling
-                    event_name = event.get('event_name', 'Unknown Event')
-                    venue_city = event.get('venue_city', 'Unknown City')
-                    display_label = f"{artist_name} - {event_name} ({venue_city})"
-                    
-                    event_options.append(display_label)
-                    event_lookup[display_label] = event
-                    
-                except Exception as e:
-                    st.warning(f"⚠️ Skipping malformed event data: {str(e)}")
-                    continue
+            # Build display labels column-wise; selections resolve back to the
+            # original event dicts so no values are coerced by pandas
+            events_df = pd.DataFrame(events_data)
+            events_by_id = {event['event_id']: event for event in events_data}
+            
+            # Use event_category_name if classified_artist_name is null/None
+            artist_names = events_df['classified_artist_name']
+            invalid_names = artist_names.isna() | artist_names.isin(INVALID_ARTIST_NAMES)
+            artist_names = artist_names.where(~invalid_names, events_df['artist_name'])
+            
+            display_labels = (
+                artist_names.astype(str) + " - " + events_df['event_name'].astype(str)
+                + " (" + events_df['venue_city'].astype(str) + ")"
+            )
+            event_options = display_labels.tolist()
+            label_to_id = dict(zip(event_options, events_df['event_id']))
             
             if not event_options:
                 st.error("❌ No valid events found in the data.")
@@ -565,15 +1111,9 @@ class SocialContentApp:
                 if selected_event_labels:
                     st.success("✅ Event selected for focused content generation")
             
-            # Get selected events data with error handling
-            selected_events = []
-            for label in selected_event_labels:
-                try:
-                    event = event_lookup[label]
-                    selected_events.append(event)
-                except KeyError:
-                    st.warning(f"⚠️ Could not find event data for: {label}")
-                    continue
+            # Resolve selected labels back to the original events
+            selected_ids = [label_to_id[label] for label in selected_event_labels]
+            selected_events = [events_by_id[event_id] for event_id in selected_ids]
             
             # Store in session state
             st.session_state.selected_events = selected_events
@@ -586,6 +1126,9 @@ class SocialContentApp:
             # Display selected events with metrics and content preview
             st.markdown(f"#### 📊 Selected Events ({len(selected_events)})")
             
+            # Insight flags for every selected event in one vectorized pass
+            event_insights = build_event_insights(selected_events)
+            
             for i, event in enumerate(selected_events, 1):
                 with st.expander(f"🎵 {i}. {event.get('classified_artist_name', event.get('artist_name', 'Unknown'))} - {event['event_name']}", expanded=False):
                     
@@ -615,7 +1158,7 @@ class SocialContentApp:
                     # Content angles identification
                     st.markdown("**🎯 Content Angles:**")
                     try:
-                        content_angles = self.pipeline.identify_content_angles(event)
+                        content_angles = self.get_content_angles(event)
                         if content_angles:
                             for angle in content_angles:
                                 # Format angle name
@@ -631,29 +1174,7 @@ class SocialContentApp:
                     
                     # Performance insights
                     st.markdown("**📈 Key Insights:**")
-                    insights = []
-                    
-                    # Rank insight
-                    rank = event.get('rank')
-                    if rank and rank <= 5:
-                        insights.append(f"🏆 Top {rank} performer")
-                    
-                    # Career performance
-                    career_multiple = event.get('career_context', {}).get('vs_career_avg_multiple', 0)
-                    if career_multiple >= 3:
-                        insights.append(f"🚀 {career_multiple:.1f}x above career average")
-                    elif career_multiple >= 2:
-                        insights.append(f"📈 {career_multiple:.1f}x above career average")
-                    
-                    # International appeal
-                    intl_pct = event.get('international_pct', 0)
-                    if intl_pct > 30:
-                        insights.append(f"🌍 {intl_pct:.0f}% international buyers")
-                    
-                    # Genre positioning
-                    genre_rank = event.get('market_position', {}).get('ytd_genre_rank')
-                    if genre_rank and genre_rank <= 10:
-                        insights.append(f"🎭 #{genre_rank} in {event.get('genre', 'genre')}")
+                    insights = event_insights[i - 1]
                     
                     if insights:
                         for insight in insights:
@@ -694,9 +1215,7 @@ class SocialContentApp:
     
     def generate_content_preview(self, event, angle):
         """Generate a preview of content for the given event and angle"""
-        artist_name = event.get('classified_artist_name', event.get('artist_name', 'Artist'))
-        if artist_name in ['Unknown', 'None', None, 'nan', '']:
-            artist_name = event.get('artist_name', 'Artist')
+        artist_name = resolve_artist_name(event, 'Artist')
         
         venue_city = event.get('venue_city', 'City')
         recent_gms = event.get('recent_7d_gms', 0)
@@ -704,105 +1223,27 @@ class SocialContentApp:
         rank = event.get('rank', 0)
         
         # Generate preview based on angle
-        if angle == 'significant_spike' and career_multiple >= 3:
-            return f"🔥 {artist_name} is ON FIRE in {venue_city}! Performing at {career_multiple:.1f}x above their career average..."
-        elif angle == 'genre_leader' and rank <= 5:
-            return f"👑 {artist_name} is CRUSHING it at #{rank} this week! Dominating the charts..."
-        elif angle == 'tour_standout' and recent_gms:
-            return f"🎪 {artist_name}'s {venue_city} show is breaking records with ${recent_gms:,.0f} in sales..."
-        elif angle == 'top_performer':
-            return f"⭐ {artist_name} continues their incredible run with another standout performance..."
-        elif angle == 'international_appeal':
-            return f"🌍 {artist_name} is capturing hearts worldwide with their {venue_city} show..."
-        else:
-            return f"📈 {artist_name} is trending with their latest performance in {venue_city}..."
+        preview = CONTENT_PREVIEWS.get(angle)
+        if preview is None or not preview[0](career_multiple, rank, recent_gms):
+            preview = DEFAULT_CONTENT_PREVIEW
+        
+        return preview[1].format(
+            artist=artist_name,
+            city=venue_city,
+            career_multiple=career_multiple,
+            rank=rank,
+            gms=recent_gms
+        )
     
     def render_prompt_editing_section(self, selected_events):
         """Render prompt editing interface with templates and preview"""
         
-        # Template definitions (copied from ai_contextualizer.py)
-        self.prompt_templates = {
-            'major_spike': {
-                'name': '🚀 Major Spike (5x+ Career Average)',
-                'template': """Create viral {platform} content about this MASSIVE performance spike. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: Performing {career_multiple:.1f}x above career average - this is HUGE
-SUPPORTING DATA: {intl_pct:.0f}% international buyers, #{rank} trending this week
-{fandom_context}"""
-            },
-            'significant_spike': {
-                'name': '📈 Significant Spike (3-5x Career Average)', 
-                'template': """Create viral {platform} content about this SIGNIFICANT performance spike. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: Performing {career_multiple:.1f}x above career average - this is significant
-SUPPORTING DATA: {intl_pct:.0f}% international buyers, #{rank} trending this week
-{fandom_context}"""
-            },
-            'genre_leader': {
-                'name': '👑 Genre Leader',
-                'template': """Create viral {platform} content celebrating this genre-leading performance. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: #{genre_rank} in {genre} this year, #{overall_rank} overall
-SUPPORTING DATA: Genre-leading performance, top tier positioning
-{fandom_context}"""
-            },
-            'tour_standout': {
-                'name': '🔥 Tour Standout',
-                'template': """Create viral {platform} content about this standout tour performance. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: {tour_multiple:.1f}x above tour average for {tour_name}
-SUPPORTING DATA: Standout performance in tour, exceptional demand
-{fandom_context}"""
-            },
-            'international_phenomenon': {
-                'name': '🌍 International Phenomenon',
-                'template': """Create viral {platform} content about this international phenomenon. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}  
-KEY INSIGHT: {intl_pct:.0f}% international buyers - incredible global appeal
-SUPPORTING DATA: Worldwide demand, cross-cultural appeal
-{fandom_context}"""
-            },
-            'top_performer': {
-                'name': '🏆 Top Performer',
-                'template': """Create viral {platform} content about this top-tier performance. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: #{rank} performer this week, consistent excellence
-SUPPORTING DATA: Top-tier positioning, strong market performance
-{fandom_context}"""
-            },
-            'trending_event': {
-                'name': '📈 Trending Event (Default)',
-                'template': """Create viral {platform} content about this trending event. Remember: NO dollar amounts!
-EVENT: {artist} - {event_name} in {location}
-KEY INSIGHT: Trending #{rank} this week, strong performance
-SUPPORTING DATA: Market momentum, fan engagement
-{fandom_context}"""
-            }
-        }
-        
-        # System prompt
-        self.system_prompt = """You are a Gen Z social media expert creating viral content for live events and entertainment. 
-Your content should be data-driven but never boring, optimized for discovery, and designed to make people stop scrolling.
-
-CRITICAL RULES:
-1. NEVER share actual dollar amounts or GMS numbers - use relative terms like "massive surge" or "top performer"
-2. Always provide TWO separate outputs: VISUAL TEXT and CAPTION
-3. Write like Gen Z (but not cringe) - authentic, direct, no millennial energy
-4. Front-load artist/team names for SEO and discovery
-
-For Instagram/TikTok:
-- VISUAL TEXT: Punchy, data-forward, shareable. Think billboard text - immediate impact, no context needed
-- CAPTION: Keyword-optimized, artist name first, context for fans, discovery-friendly hashtags
-- Make it something fans want to repost to their Stories with their own reaction"""
-        
         # Event selection for prompt editing
         if len(selected_events) > 1:
-            event_options = []
-            for i, event in enumerate(selected_events):
-                artist_name = event.get('classified_artist_name', event.get('artist_name', 'Unknown'))
-                if artist_name in ['Unknown', 'None', None, 'nan', '']:
-                    artist_name = event.get('artist_name', 'Unknown')
-                event_options.append(f"{i+1}. {artist_name} - {event['event_name']}")
+            event_options = [
+                f"{i}. {resolve_artist_name(event)} - {event['event_name']}"
+                for i, event in enumerate(selected_events, 1)
+            ]
             
             selected_event_idx = st.selectbox(
                 "Choose event to customize prompt for:",
@@ -813,27 +1254,23 @@ For Instagram/TikTok:
             current_event = selected_events[selected_event_idx]
         else:
             current_event = selected_events[0]
-            artist_name = current_event.get('classified_artist_name', current_event.get('artist_name', 'Unknown'))
-            if artist_name in ['Unknown', 'None', None, 'nan', '']:
-                artist_name = current_event.get('artist_name', 'Unknown')
+            artist_name = resolve_artist_name(current_event)
             st.info(f"📝 Editing prompt for: **{artist_name} - {current_event['event_name']}**")
         
         # Get content angles for this event
         try:
-            available_angles = self.pipeline.identify_content_angles(current_event)
-            if not available_angles:
-                available_angles = ['trending_event']
+            available_angles = frozenset(self.get_content_angles(current_event)) or frozenset({'trending_event'})
         except:
-            available_angles = ['trending_event']
+            available_angles = frozenset({'trending_event'})
         
         # Template selection
         col1, col2 = st.columns([1, 1])
         
         with col1:
             # Filter templates to show only relevant ones + default
-            relevant_templates = {k: v for k, v in self.prompt_templates.items() if k in available_angles}
+            relevant_templates = {k: v for k, v in PROMPT_TEMPLATES.items() if k in available_angles}
             if not relevant_templates:
-                relevant_templates = {'trending_event': self.prompt_templates['trending_event']}
+                relevant_templates = {'trending_event': PROMPT_TEMPLATES['trending_event']}
             
             selected_template = st.selectbox(
                 "📋 Choose Template:",
@@ -897,35 +1334,22 @@ For Instagram/TikTok:
         with st.expander("🔧 Advanced: Edit System Prompt", expanded=False):
             edited_system_prompt = st.text_area(
                 "System Prompt:",
-                value=self.system_prompt,
+                value=SYSTEM_PROMPT,
                 height=300,
                 help="Edit the system prompt that provides context to ChatGPT"
             )
         
         if 'edited_system_prompt' not in locals():
-            edited_system_prompt = self.system_prompt
+            edited_system_prompt = SYSTEM_PROMPT
         
         # Generate preview data
         st.markdown("#### 👀 Prompt Preview")
         
         # Prepare data for placeholder replacement
-        artist_name = current_event.get('classified_artist_name', current_event.get('artist_name', 'Unknown'))
-        if artist_name in ['Unknown', 'None', None, 'nan', '']:
-            artist_name = current_event.get('artist_name', 'Unknown')
+        artist_name = resolve_artist_name(current_event)
         
         # Genre-specific fandom context
-        genre = current_event.get('genre', '').lower()
-        fandom_context = ""
-        if 'hip hop' in genre or 'rap' in genre:
-            fandom_context = "Consider adding hip-hop culture references if relevant"
-        elif 'rock' in genre:
-            fandom_context = "Consider rock/metal culture references if relevant"
-        elif 'country' in genre:
-            fandom_context = "Consider country music culture references if relevant"
-        elif 'pop' in genre:
-            fandom_context = "Consider pop culture references if relevant"
-        elif 'sports' in genre:
-            fandom_context = "Consider sports culture and team loyalty references if relevant"
+        fandom_context = get_fandom_context(current_event.get('genre', ''))
         
         preview_data = {
             'artist': artist_name,
@@ -935,19 +1359,23 @@ For Instagram/TikTok:
             'genre': current_event.get('genre', 'Music'),
             'venue_city': current_event.get('venue_city', 'City'),
             'venue_country': current_event.get('venue_country', 'Country'),
-            'career_multiple': current_event.get('career_context', {}).get('vs_career_avg_multiple', 2.5),
+            'career_multiple': get_nested(current_event, ('career_context', 'vs_career_avg_multiple'), 2.5),
             'intl_pct': current_event.get('international_pct', 15),
-            'genre_rank': current_event.get('market_position', {}).get('ytd_genre_rank', 5),
-            'overall_rank': current_event.get('market_position', {}).get('ytd_overall_rank', 10),
-            'tour_name': current_event.get('tour_context', {}).get('tour_name', 'World Tour'),
-            'tour_multiple': current_event.get('tour_context', {}).get('vs_tour_avg_multiple', 1.8),
+            'genre_rank': get_nested(current_event, ('market_position', 'ytd_genre_rank'), 5),
+            'overall_rank': get_nested(current_event, ('market_position', 'ytd_overall_rank'), 10),
+            'tour_name': get_nested(current_event, ('tour_context', 'tour_name'), 'World Tour'),
+            'tour_multiple': get_nested(current_event, ('tour_context', 'vs_tour_avg_multiple'), 1.8),
             'platform': platform,
             'fandom_context': fandom_context
         }
         
         # Generate final prompt preview
         try:
-            final_prompt = edited_prompt.format(**preview_data)
+            # Unedited templates use the pre-parsed form
+            if edited_prompt == current_template:
+                final_prompt = format_parsed_template(PARSED_PROMPT_TEMPLATES[selected_template], preview_data)
+            else:
+                final_prompt = edited_prompt.format(**preview_data)
             
             col1, col2 = st.columns(2)
             
@@ -957,20 +1385,26 @@ For Instagram/TikTok:
             
             with col2:
                 st.markdown("**🤖 System Prompt:**")
-                st.code(edited_system_prompt[:500] + "..." if len(edited_system_prompt) > 500 else edited_system_prompt, language="text")
-            
-            # Store edited prompts in session state for use during generation
-            if 'custom_prompts' not in st.session_state:
-                st.session_state['custom_prompts'] = {}
+                if edited_system_prompt == SYSTEM_PROMPT:
+                    display_system_prompt = SYSTEM_PROMPT_PREVIEW
+                elif len(edited_system_prompt) <= SYSTEM_PROMPT_PREVIEW_CHARS:
+                    display_system_prompt = edited_system_prompt
+                else:
+                    display_system_prompt = f"{edited_system_prompt[:SYSTEM_PROMPT_PREVIEW_CHARS]}..."
+                st.code(display_system_prompt, language="text")
             
-            st.session_state['custom_prompts'] = {
+            # Store edited prompts in session state for use during generation,
+            # only writing (and confirming) when something actually changed
+            new_prompts = {
                 'user_prompt_template': edited_prompt,
                 'system_prompt': edited_system_prompt,
                 'selected_template': selected_template,
                 'platform': platform
             }
             
-            st.success("✅ Prompt customization saved! These will be used during content generation.")
+            if st.session_state.get('custom_prompts') != new_prompts:
+                st.session_state['custom_prompts'] = new_prompts
+                st.success("✅ Prompt customization saved! These will be used during content generation.")
             
         except KeyError as e:
             st.error(f"❌ Invalid placeholder in prompt: {e}")
@@ -980,12 +1414,8 @@ For Instagram/TikTok:
     
     def run_enhanced_content_generation(self, selected_events):
         """Run enhanced content generation with real-time progress and error handling"""
-        import time
-        from ai_contextualizer import ContentGenerator
-        
-        
         # Initialize content generator
-        content_generator = ContentGenerator()
+        content_generator = get_content_generator(get_setting('OPENAI_API_KEY'), get_setting('OPENAI_MODEL', 'gpt-4o'))
         
         # Check for custom prompts
         custom_prompts = st.session_state.get('custom_prompts', {})
@@ -994,9 +1424,6 @@ For Instagram/TikTok:
         main_progress = st.progress(0)
         main_status = st.empty()
         
-        # Real-time content display
-        content_container = st.container()
-        
         try:
             # Step 1: Prepare events
             main_status.text("🔗 Preparing events for content generation...")
@@ -1012,7 +1439,7 @@ For Instagram/TikTok:
             
             for event in selected_events:
                 try:
-                    angles = self.pipeline.identify_content_angles(event)
+                    angles = self.get_content_angles(event)
                     if not angles:
                         angles = ['trending_event']
                     event_content_map[event['event_id']] = angles
@@ -1028,21 +1455,19 @@ For Instagram/TikTok:
             # Step 2: Generate content with real-time updates
             main_status.text("✍️ Generating social media content...")
             
-            all_content = []
-            current_piece = 0
+            # Real-time content display sections, inside a status block whose
+            # label tracks progress as pieces arrive
+            st.markdown("### 🎨 Generated Content (Real-time)")
+            content_status = st.status(f"✍️ Generating {total_pieces} pieces of content...", expanded=True)
             
-            # Real-time content display sections
-            with content_container:
-                st.markdown("### 🎨 Generated Content (Real-time)")
-                content_placeholder = st.empty()
-                
+            with content_status:
+                # Walk the events once to build the task list and queue the display
                 content_display = {}
+                tasks = []
                 
                 for event in selected_events:
                     event_id = event['event_id']
-                    artist_name = event.get('classified_artist_name', event.get('artist_name', 'Unknown'))
-                    if artist_name in ['Unknown', 'None', None, 'nan', '']:
-                        artist_name = event.get('artist_name', 'Unknown')
+                    artist_name = resolve_artist_name(event)
                     
                     angles = event_content_map.get(event_id, ['trending_event'])
                     
@@ -1050,23 +1475,58 @@ For Instagram/TikTok:
                     event_key = f"{artist_name} - {event['event_name']}"
                     content_display[event_key] = {}
                     
-                    # Generate content for each angle
                     for angle in angles:
-                        current_piece += 1
-                        piece_progress = current_piece / total_pieces
-                        
-                        # Update main progress
-                        main_progress.progress(0.2 + (piece_progress * 0.6))
-                        main_status.text(f"✍️ Generating {angle.replace('_', ' ').title()} content for {artist_name}... ({current_piece}/{total_pieces})")
+                        content_display[event_key][angle] = {
+                            'status': '⏳ Queued',
+                            'content': None,
+                            'error': None
+                        }
+                        tasks.append((event_key, event, angle))
+                
+                # One placeholder per event so a refresh only redraws the events
+                # whose pieces changed
+                event_placeholders = {event_key: st.empty() for event_key in content_display}
+                for event_key, angles_data in content_display.items():
+                    self.update_content_display(event_placeholders[event_key], event_key, angles_data)
+                
+                # Generate pieces concurrently; results are slotted by task index
+                # so the final content keeps the event/angle order
+                results = [None] * len(tasks)
+                changed_events = set()
+                
+                # Finished pieces are published to session state as they arrive,
+                # so an interrupted run still leaves them on the View Results page
+                partial_content = []
+                last_refresh = time.monotonic()
+                
+                # The executor is shut down without waiting, so a rerun or stop
+                # cancels the queued calls instead of blocking until they finish
+                executor = ThreadPoolExecutor(max_workers=GENERATION_MAX_WORKERS)
+                try:
+                    futures = {
+                        executor.submit(
+                            self.generate_content_with_retry,
+                            content_generator, event, angle, custom_prompts
+                        ): index
+                        for index, (event_key, event, angle) in enumerate(tasks)
+                    }
+                    
+                    for current_piece, future in enumerate(as_completed(futures), 1):
+                        index = futures[future]
+                        event_key, event, angle = tasks[index]
                         
-                        # Generate individual piece with error handling
                         try:
-                            content_item = self.generate_single_content_piece(
-                                content_generator, event, angle, custom_prompts
-                            )
+                            content_item = future.result()
                             
                             if content_item:
-                                all_content.append(content_item)
+                                results[index] = content_item
+                                partial_content.append(content_item)
+                                # Publish a fresh list; the filter and export caches
+                                # key on list identity, so a published list is never mutated.
+                                # Copying per piece is O(n^2) over a run; at the few hundred
+                                # pieces a run can hold (50 events at most) that is negligible
+                                st.session_state['generated_content'] = list(partial_content)
+                                st.session_state['content_generated'] = True
                                 content_display[event_key][angle] = {
                                     'status': '✅ Generated',
                                     'content': content_item,
@@ -1080,26 +1540,40 @@ For Instagram/TikTok:
                                 }
                         
                         except Exception as e:
-                            error_msg = str(e)
                             content_display[event_key][angle] = {
                                 'status': '❌ Error',
                                 'content': None,
-                                'error': error_msg
+                                'error': str(e)
                             }
-                            
-                            # Handle specific errors
-                            if "rate_limit" in error_msg.lower():
-                                st.warning("⏱️ Rate limit detected. Waiting 10 seconds...")
-                                time.sleep(10)
-                            elif "timeout" in error_msg.lower():
-                                st.warning("⏱️ Timeout detected. Retrying in 5 seconds...")
-                                time.sleep(5)
                         
-                        # Update real-time display
-                        self.update_content_display(content_placeholder, content_display)
+                        # Update main progress
+                        piece_progress = current_piece / total_pieces
+                        main_progress.progress(0.2 + (piece_progress * 0.6))
+                        main_status.text(f"✍️ Generated {format_angle_name(angle)} content for {event_key}... ({current_piece}/{total_pieces})")
+                        content_status.update(label=f"✍️ Generated {current_piece}/{total_pieces} pieces of content...")
                         
-                        # Small delay to prevent rate limiting
-                        time.sleep(1)
+                        # Throttle real-time display refreshes to the changed events
+                        changed_events.add(event_key)
+                        now = time.monotonic()
+                        if now - last_refresh >= DISPLAY_REFRESH_INTERVAL_SECONDS or current_piece == total_pieces:
+                            for changed_key in changed_events:
+                                self.update_content_display(event_placeholders[changed_key], changed_key, content_display[changed_key])
+                            changed_events.clear()
+                            last_refresh = now
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                
+                all_content = [item for item in results if item]
+                failed_pieces = [
+                    f"{event_key} - {format_angle_name(angle)}"
+                    for (event_key, event, angle), item in zip(tasks, results)
+                    if not item
+                ]
+            
+            content_status.update(
+                label=f"Generated {len(all_content)}/{total_pieces} pieces of content",
+                state="error" if failed_pieces else "complete"
+            )
             
             # Step 3: Process and display results
             main_status.text("📋 Organizing generated content...")
@@ -1119,7 +1593,7 @@ For Instagram/TikTok:
                     st.metric("Content Pieces", len(all_content))
                 
                 with col2:
-                    unique_events = len(set(item['event_id'] for item in all_content))
+                    unique_events = len({item['event_id'] for item in all_content})
                     st.metric("Events Covered", unique_events)
                 
                 with col3:
@@ -1141,7 +1615,7 @@ For Instagram/TikTok:
                 self.render_human_readable_content(all_content)
                 
                 # Show regeneration options
-                self.render_regeneration_interface(content_display, selected_events)
+                self.render_regeneration_interface(failed_pieces, selected_events)
                 
             else:
                 st.error("❌ No content was generated successfully")
@@ -1163,29 +1637,31 @@ For Instagram/TikTok:
             st.warning("⚠️ No content to display")
             return
         
-        # Group content by artist
-        content_by_artist = {}
+        # Group content by artist and collect angles in a single pass
+        content_by_artist = defaultdict(list)
+        angles = set()
         for item in content_data:
-            artist = item.get('artist_name', 'Unknown')
-            if artist not in content_by_artist:
-                content_by_artist[artist] = []
-            content_by_artist[artist].append(item)
+            content_by_artist[item.get('artist_name', 'Unknown')].append(item)
+            angles.add(item['content_angle'])
         
         # Summary
         total_pieces = len(content_data)
         unique_artists = len(content_by_artist)
-        angles = list(set(item['content_angle'] for item in content_data))
         
         st.info(f"📊 **Summary:** {total_pieces} content pieces for {unique_artists} artists using {len(angles)} content angles")
         
+        # Angle emoji and titles only depend on the small angle vocabulary
+        emoji_map = {angle: self.get_angle_emoji(angle) for angle in angles}
+        title_map = {angle: angle.replace('_', ' ').title() for angle in angles}
+        
         # Display content by artist
         for artist, items in content_by_artist.items():
             with st.expander(f"🎭 {artist.upper()} ({len(items)} pieces)", expanded=True):
                 
                 for i, item in enumerate(items, 1):
                     # Content angle header
-                    angle_emoji = self.get_angle_emoji(item['content_angle'])
-                    formatted_angle = item['content_angle'].replace('_', ' ').title()
+                    angle_emoji = emoji_map[item['content_angle']]
+                    formatted_angle = title_map[item['content_angle']]
                     
                     st.markdown(f"### {angle_emoji} {formatted_angle} - {item['event_name']}")
                     
@@ -1202,6 +1678,7 @@ For Instagram/TikTok:
                         st.caption(f"📍 {location}")
                     
                     # Visual Text
+                    copy_buttons = []
                     if item.get('visual_text'):
                         # Check if this is an error message
                         if item.get('error') or item['visual_text'].startswith('❌'):
@@ -1214,19 +1691,17 @@ For Instagram/TikTok:
                         else:
                             st.markdown("**🎯 Visual Text:**")
                             st.info(item['visual_text'])
-                            
-                            # Copy button for visual text
-                            if st.button(f"📋 Copy Visual Text", key=f"copy_visual_{i}_{artist}_{item['content_angle']}", help="Copy visual text to clipboard"):
-                                st.code(item['visual_text'])
+                            copy_buttons.append(("📋 Copy Visual Text", item['visual_text']))
                     
                     # Caption
                     if item.get('caption') and not item.get('error'):
                         st.markdown("**📝 Caption:**")
                         st.success(item['caption'])
-                        
-                        # Copy button for caption
-                        if st.button(f"📋 Copy Caption", key=f"copy_caption_{i}_{artist}_{item['content_angle']}", help="Copy caption to clipboard"):
-                            st.code(item['caption'])
+                        copy_buttons.append(("📋 Copy Caption", item['caption']))
+                    
+                    # Copy buttons for this piece, in one iframe
+                    if copy_buttons:
+                        render_copy_buttons(copy_buttons)
                     
                     # Event metrics (collapsible)
                     with st.expander("📈 Event Metrics", expanded=False):
@@ -1239,7 +1714,7 @@ For Instagram/TikTok:
                             if recent_gms:
                                 st.metric("Recent 7d GMS", f"${recent_gms:,.0f}")
                             
-                            career_multiple = event_data.get('career_context', {}).get('vs_career_avg_multiple', 0)
+                            career_multiple = get_nested(event_data, ('career_context', 'vs_career_avg_multiple'), 0)
                             if career_multiple:
                                 st.metric("vs Career Avg", f"{career_multiple:.1f}x")
                         
@@ -1258,14 +1733,26 @@ For Instagram/TikTok:
                                 
                             generated_at = item.get('generated_at', '')
                             if generated_at:
-                                try:
-                                    dt = datetime.fromisoformat(generated_at.replace('Z', '+00:00'))
-                                    st.metric("Generated", dt.strftime("%H:%M:%S"))
-                                except:
-                                    st.metric("Generated", "Now")
+                                st.metric("Generated", format_timestamp(generated_at, "%H:%M:%S", "Now"))
                     
                     st.markdown("---")
     
+    def generate_content_with_retry(self, content_generator, event, angle, custom_prompts):
+        """Generate a single piece, backing off exponentially on rate limits"""
+        delay = GENERATION_RETRY_DELAY_SECONDS
+        
+        for attempt in range(GENERATION_MAX_RETRIES + 1):
+            try:
+                return self.generate_single_content_piece(
+                    content_generator, event, angle, custom_prompts
+                )
+            except Exception as e:
+                message = str(e).lower()
+                if attempt == GENERATION_MAX_RETRIES or ("rate_limit" not in message and "rate limit" not in message):
+                    raise
+                time.sleep(delay)
+                delay *= 2
+    
     def generate_single_content_piece(self, content_generator, event, angle, custom_prompts):
         """Generate a single piece of content with custom prompt support"""
         try:
@@ -1282,18 +1769,24 @@ For Instagram/TikTok:
                 platform=platform
             )
             
+            # ContentGenerator reports API failures (rate limits included) as an
+            # error dict; raise so retries see them and the piece counts as failed
+            if content.get('error'):
+                raise Exception(content.get('visual_text', 'Content generation error').lstrip('❌ '))
+            
             # Create content item
+            event_id, event_name, data_completeness = CONTENT_EVENT_FIELDS(event)
             content_item = {
-                'event_id': event['event_id'],
+                'event_id': event_id,
                 'artist_name': event.get('classified_artist_name', event.get('artist_name', 'Unknown')),
-                'event_name': event['event_name'],
+                'event_name': event_name,
                 'content_angle': angle,
                 'platform': platform,
                 'visual_text': content.get('visual_text', ''),
                 'caption': content.get('caption', ''),
                 'event_data': event,
                 'generated_at': datetime.now().isoformat(),
-                'data_quality_score': event['data_completeness']['completeness_score']
+                'data_quality_score': data_completeness['completeness_score']
             }
             
             return content_item
@@ -1301,49 +1794,30 @@ For Instagram/TikTok:
         except Exception as e:
             raise Exception(f"Failed to generate {angle} content: {str(e)}")
     
-    def update_content_display(self, placeholder, content_display):
-        """Update the real-time content display"""
-        display_html = ""
-        
-        for event_key, angles_data in content_display.items():
-            display_html += f"<h4>🎵 {event_key}</h4>"
+    def update_content_display(self, placeholder, event_key, angles_data):
+        """Update one event's block in the real-time content display"""
+        with placeholder.container():
+            st.markdown(f"#### 🎵 {event_key}")
             
             for angle, data in angles_data.items():
-                status = data['status']
-                content = data['content']
-                error = data['error']
+                st.markdown(f"**{format_angle_name(angle)}:** {data['status']}")
                 
-                angle_name = angle.replace('_', ' ').title()
-                display_html += f"<div style='margin-left: 20px; margin-bottom: 10px;'>"
-                display_html += f"<strong>{angle_name}:</strong> {status}"
+                visual_text = data['content'].get('visual_text') if data['content'] else None
+                if visual_text:
+                    st.caption(f"Preview: {visual_text[:100]}...")
                 
-                if content:
-                    visual_text = content.get('visual_text', '')[:100]
-                    if len(visual_text) > 0:
-                        display_html += f"<br><em>Preview: {visual_text}...</em>"
-                
-                if error:
-                    display_html += f"<br><span style='color: red;'>Error: {error}</span>"
-                
-                display_html += "</div>"
+                if data['error']:
+                    st.error(f"Error: {data['error']}")
             
-            display_html += "<hr>"
-        
-        placeholder.markdown(display_html, unsafe_allow_html=True)
+            st.markdown("---")
     
-    def render_regeneration_interface(self, content_display, selected_events):
+    def render_regeneration_interface(self, failed_pieces, selected_events):
         """Render interface for regenerating individual content pieces"""
         st.markdown("### 🔄 Regenerate Content")
         
         with st.expander("♻️ Regenerate Individual Pieces", expanded=False):
             st.markdown("Select failed or unsatisfactory content pieces to regenerate:")
             
-            failed_pieces = []
-            for event_key, angles_data in content_display.items():
-                for angle, data in angles_data.items():
-                    if data['status'] in ['❌ Failed', '❌ Error']:
-                        failed_pieces.append(f"{event_key} - {angle.replace('_', ' ').title()}")
-            
             if failed_pieces:
                 st.warning(f"⚠️ {len(failed_pieces)} pieces failed to generate")
                 
@@ -1372,7 +1846,7 @@ For Instagram/TikTok:
             
             if regenerate_event is not None:
                 event = selected_events[regenerate_event]
-                angles = self.pipeline.identify_content_angles(event)
+                angles = self.get_content_angles(event)
                 
                 regenerate_angle = st.selectbox(
                     "Choose content angle:",
@@ -1384,7 +1858,7 @@ For Instagram/TikTok:
                 if st.button("🎯 Regenerate This Piece", type="secondary"):
                     with st.spinner("Regenerating content..."):
                         try:
-                            content_generator = ContentGenerator()
+                            content_generator = get_content_generator(get_setting('OPENAI_API_KEY'), get_setting('OPENAI_MODEL', 'gpt-4o'))
                             new_content = self.generate_single_content_piece(
                                 content_generator, event, regenerate_angle, 
                                 st.session_state.get('custom_prompts', {})
@@ -1409,10 +1883,10 @@ For Instagram/TikTok:
             return False, "Snowflake connector not initialized"
         
         try:
-            if self.snowflake_connector.test_connection():
-                return True, "Connection successful"
-            else:
-                return False, "Connection test failed"
+            probe_snowflake(self.snowflake_connector, self.snowflake_connector.is_local)
+            return True, "Connection successful"
+        except ConnectionError as e:
+            return False, str(e)
         except Exception as e:
             return False, f"Connection error: {str(e)}"
     
@@ -1519,69 +1993,69 @@ For Instagram/TikTok:
         """Show current session status in sidebar"""
         st.sidebar.subheader("📊 Session Status")
         
-        # Data status
-        if st.session_state.data_loaded:
-            st.sidebar.success(f"✅ Data: {len(st.session_state.structured_events)} events")
-        else:
-            st.sidebar.warning("⚠️ No data loaded")
-        
-        # Selection status
-        if st.session_state.selected_events:
-            st.sidebar.info(f"🎯 Selected: {len(st.session_state.selected_events)} events")
-        
-        # Content status
-        if st.session_state.content_generated:
-            st.sidebar.success(f"✅ Content: {len(st.session_state.generated_content)} pieces")
+        # Status lines are rebuilt only when the session fingerprint changes,
+        # but still emitted every run so the sidebar keeps them
+        status_lines = build_session_status(
+            len(st.session_state.structured_events) if st.session_state.data_loaded else None,
+            len(st.session_state.selected_events) if st.session_state.selected_events else 0,
+            len(st.session_state.generated_content) if st.session_state.content_generated else None,
+            st.session_state.last_error
+        )
         
-        # Error status
-        if st.session_state.last_error:
-            st.sidebar.error(f"❌ Last error: {st.session_state.last_error[:50]}...")
+        for kind, message in status_lines:
+            getattr(st.sidebar, kind)(message)
     
-    def run_connection_tests(self):
-        """Test all connections and display results"""
-        st.sidebar.markdown("**Testing connections...**")
+    def check_snowflake_connection(self):
+        """Test Snowflake connection without any st.* calls, so it can run in a worker thread"""
+        if not self.snowflake_connector:
+            return False, "Snowflake connector not initialized"
         
-        # Test Snowflake
         try:
-            with st.spinner("Testing Snowflake..."):
-                success, message = self.test_snowflake_connection()
-                if success:
-                    st.sidebar.success(f"✅ Snowflake: Connected")
-                else:
-                    st.sidebar.error(f"❌ Snowflake: {message}")
+            if self.snowflake_connector.test_connection():
+                return True, "Connection successful"
+            return False, "Connection test failed"
         except Exception as e:
-            st.sidebar.error(f"❌ Snowflake: Error - {str(e)}")
-        
-        # Test OpenAI
+            return False, f"Connection error: {str(e)}"
+    
+    def check_openai_connection(self, api_key, model):
+        """Test OpenAI connection without any st.* calls, so it can run in a worker thread"""
         try:
-            import os
-            from openai import OpenAI
-            
-            # Get API key from environment or secrets
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key and hasattr(st, 'secrets') and 'OPENAI_API_KEY' in st.secrets:
-                api_key = st.secrets['OPENAI_API_KEY']
-            
-            if api_key:
-                with st.spinner("Testing OpenAI..."):
-                    client = OpenAI(api_key=api_key)
-                    # Get model from environment or secrets
-                    model = os.getenv('OPENAI_MODEL')
-                    if not model and hasattr(st, 'secrets') and 'OPENAI_MODEL' in st.secrets:
-                        model = st.secrets['OPENAI_MODEL']
-                    if not model:
-                        model = 'gpt-4o'
-                    
-                    client.chat.completions.create(
-                        model=model,
-                        messages=[{"role": "user", "content": "test"}],
-                        max_tokens=5
-                    )
-                    st.sidebar.success("✅ OpenAI: Connected")
-            else:
-                st.sidebar.error("❌ OpenAI: No API key found in environment or secrets")
+            send_openai_probe(api_key, model)
+            return True, "Connected"
         except Exception as e:
-            st.sidebar.error(f"❌ OpenAI: {str(e)}")
+            return False, str(e)
+    
+    def run_connection_tests(self):
+        """Test all connections concurrently and display results as they finish"""
+        st.sidebar.markdown("**Testing connections...**")
+        
+        # Get API key and model from environment or secrets
+        api_key = get_setting('OPENAI_API_KEY')
+        model = get_setting('OPENAI_MODEL', 'gpt-4o')
+        
+        placeholders = {'Snowflake': st.sidebar.empty(), 'OpenAI': st.sidebar.empty()}
+        if not api_key:
+            placeholders['OpenAI'].error("❌ OpenAI: No API key found in environment or secrets")
+        
+        # Both checks are I/O bound; workers only return (success, message) and
+        # every st.* call below stays on the script thread
+        with st.spinner("Testing connections..."):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {executor.submit(self.check_snowflake_connection): 'Snowflake'}
+                if api_key:
+                    futures[executor.submit(self.check_openai_connection, api_key, model)] = 'OpenAI'
+                
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        success, message = future.result()
+                    except Exception as e:
+                        success, message = False, f"Error - {str(e)}"
+                    
+                    if success:
+                        placeholders[name].success(f"✅ {name}: Connected")
+                    else:
+                        placeholders[name].error(f"❌ {name}: {message}")
     
     def render_dashboard(self):
         """Render main dashboard"""
@@ -1701,13 +2175,11 @@ For Instagram/TikTok:
             """)
         
         # Recent files
-        if os.path.exists("data/generated_content"):
-            files = [f for f in os.listdir("data/generated_content") if f.endswith('.json')]
-            if files:
-                st.subheader("📁 Recent Generated Content")
-                latest_files = sorted(files, reverse=True)[:5]
-                for file in latest_files:
-                    st.text(f"📄 {file}")
+        latest_files = list_recent_content_files(CONTENT_DIR)
+        if latest_files:
+            st.subheader("📁 Recent Generated Content")
+            for file in latest_files:
+                st.text(f"📄 {file}")
     
     def render_connection_test(self):
         """Render connection test page"""
@@ -1715,11 +2187,18 @@ For Instagram/TikTok:
         
         st.markdown("Test your connections to ensure everything is working properly.")
         
+        force_refresh = st.checkbox(
+            "🔁 Force refresh",
+            help=f"Ignore connection results cached in the last {CONNECTION_PROBE_TTL_SECONDS} seconds"
+        )
+        
         # Test both connections
         col1, col2 = st.columns(2)
         
         with col1:
             if st.button("🗄️ Test Snowflake", type="primary", use_container_width=True):
+                if force_refresh:
+                    clear_connection_probes()
                 with st.spinner("Testing Snowflake connection..."):
                     success, message = self.test_snowflake_connection()
                     
@@ -1744,12 +2223,16 @@ For Instagram/TikTok:
         
         with col2:
             if st.button("🤖 Test OpenAI", type="secondary", use_container_width=True):
+                if force_refresh:
+                    clear_connection_probes()
                 self.test_openai_connection()
         
         # Test all connections at once
         st.markdown("---")
         if st.button("🔌 Test All Connections", use_container_width=True):
             st.markdown("### 🧪 Testing All Connections")
+            if force_refresh:
+                clear_connection_probes()
             
             # Test Snowflake
             st.markdown("**Testing Snowflake...**")
@@ -1768,36 +2251,30 @@ For Instagram/TikTok:
         st.markdown("#### 🤖 OpenAI Connection Test")
         
         try:
-            from ai_contextualizer import ContentGenerator
+            api_key = get_setting('OPENAI_API_KEY')
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY not found. Please set it in Snowflake secrets or environment variables.")
             
             with st.spinner("Testing OpenAI connection..."):
-                # Initialize content generator (this will test the connection)
-                generator = ContentGenerator()
-                
-                # Test with a simple call
-                test_response = generator.client.chat.completions.create(
-                    model=generator.model,
-                    messages=[{"role": "user", "content": "Say 'test successful'"}],
-                    max_tokens=10
-                )
-                
-                result = test_response.choices[0].message.content.strip()
-                st.success(f"✅ OpenAI: Connected successfully")
-                st.info(f"💬 Test response: {result}")
+                # Test with a simple call (reused for a minute across reruns)
+                result = probe_openai(api_key, get_setting('OPENAI_MODEL', 'gpt-4o'))
+                st.success(f"✅ OpenAI: Connected successfully\n\n💬 Test response: {result}")
                 
         except Exception as e:
             error_msg = str(e)
-            st.error(f"❌ OpenAI Connection Failed: {error_msg}")
-            
-            # Simple error guidance
-            if "connection" in error_msg.lower() or "network" in error_msg.lower():
-                st.warning("⚠️ **Network Issue**: Snowflake may be blocking external API calls. Contact your administrator to whitelist api.openai.com")
-            elif "invalid_api_key" in error_msg.lower() or "unauthorized" in error_msg.lower():
-                st.warning("⚠️ **API Key Issue**: Check your OpenAI API key configuration")
-            elif "model" in error_msg.lower() and "does not exist" in error_msg.lower():
-                st.warning("⚠️ **Model Issue**: The specified model may not be available on your OpenAI plan")
+            lowered = error_msg.lower()
+            
+            # Simple error guidance, shown in the same block as the error
+            if "connection" in lowered or "network" in lowered:
+                guidance = "⚠️ **Network Issue**: Snowflake may be blocking external API calls. Contact your administrator to whitelist api.openai.com"
+            elif "invalid_api_key" in lowered or "unauthorized" in lowered:
+                guidance = "⚠️ **API Key Issue**: Check your OpenAI API key configuration"
+            elif "model" in lowered and "does not exist" in lowered:
+                guidance = "⚠️ **Model Issue**: The specified model may not be available on your OpenAI plan"
             else:
-                st.warning("⚠️ **Unknown Issue**: Please check your OpenAI API configuration")
+                guidance = "⚠️ **Unknown Issue**: Please check your OpenAI API configuration"
+            
+            st.error(f"❌ OpenAI Connection Failed: {error_msg}\n\n{guidance}")
     
     def render_data_preview(self):
         """Render data preview page with comprehensive loading section"""
@@ -1843,7 +2320,7 @@ For Instagram/TikTok:
         
         # Structure the events data first for selection
         try:
-            events_data = self.pipeline.structure_event_data(cached_data)
+            events_data = structure_events_cached(self.pipeline, cached_data)
             if not events_data:
                 st.error("❌ No events available for selection")
                 return
@@ -1871,7 +2348,7 @@ For Instagram/TikTok:
             st.metric("Target Platform", platform.title())
         
         with col3:
-            total_angles = sum(len(self.pipeline.identify_content_angles(event)) for event in selected_events)
+            total_angles = sum(len(self.get_content_angles(event)) for event in selected_events)
             st.metric("Content Pieces", total_angles)
         
         # Prompt Editing Section
@@ -1942,23 +2419,20 @@ For Instagram/TikTok:
         st.success(f"📊 Latest Generated Content ({len(content_data)} pieces)")
         
         # Summary metrics
+        summary = summarize_content(content_data)
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            unique_events = len(set(item.get('event_id', '') for item in content_data))
-            st.metric("Unique Events", unique_events)
+            st.metric("Unique Events", summary['unique_events'])
         
         with col2:
-            unique_angles = len(set(item.get('content_angle', '') for item in content_data))
-            st.metric("Content Angles", unique_angles)
+            st.metric("Content Angles", len(summary['content_angles']))
         
         with col3:
-            platforms = set(item.get('platform', 'unknown') for item in content_data)
-            st.metric("Platforms", len(platforms))
+            st.metric("Platforms", len(summary['platforms']))
         
         with col4:
-            avg_quality = sum(item.get('data_quality_score', 0) for item in content_data) / len(content_data)
-            st.metric("Avg Quality", f"{avg_quality:.1%}")
+            st.metric("Avg Quality", f"{summary['average_quality_score']:.1%}")
         
         st.markdown("---")
         
@@ -1987,13 +2461,26 @@ For Instagram/TikTok:
                 help="Number of content pieces per row (Grid View only)"
             ) if display_mode == "Grid View" else 2
         
+        # Paginate so a rerun only renders one page of items
+        page_count = max(1, math.ceil(len(filtered_content) / CONTENT_PAGE_SIZE))
+        page = st.number_input(
+            f"Page (of {page_count}):",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            step=1,
+            help=f"{CONTENT_PAGE_SIZE} content pieces per page"
+        ) if page_count > 1 else 1
+        start = (page - 1) * CONTENT_PAGE_SIZE
+        page_content = filtered_content[start:start + CONTENT_PAGE_SIZE]
+        
         # Render content based on display mode
         if display_mode == "Grid View":
-            self.render_grid_view(filtered_content, items_per_row)
+            self.render_grid_view(page_content, items_per_row, start + 1)
         elif display_mode == "List View":
-            self.render_list_view(filtered_content)
+            self.render_list_view(page_content, start + 1)
         else:  # Card View
-            self.render_card_view(filtered_content)
+            self.render_card_view(page_content, start + 1)
         
         # Download section
         st.markdown("---")
@@ -2001,69 +2488,102 @@ For Instagram/TikTok:
     
     def render_content_filters(self, content_data):
         """Render filtering and sorting controls"""
-        st.markdown("### 🔍 Filter & Sort")
-        
-        filter_col1, filter_col2, filter_col3 = st.columns(3)
+        # Nothing to filter or sort with a single piece
+        if len(content_data) < CONTENT_FILTER_MIN_ITEMS:
+            return content_data
         
-        with filter_col1:
-            # Artist filter
-            all_artists = sorted(set(item.get('artist_name', 'Unknown') for item in content_data))
-            selected_artists = st.multiselect(
-                "Filter by Artist:",
-                options=all_artists,
-                default=all_artists,
-                help="Select artists to display"
-            )
-        
-        with filter_col2:
-            # Content angle filter
-            all_angles = sorted(set(item.get('content_angle', 'unknown') for item in content_data))
-            selected_angles = st.multiselect(
-                "Filter by Content Angle:",
-                options=all_angles,
-                default=all_angles,
-                format_func=lambda x: x.replace('_', ' ').title(),
-                help="Select content angles to display"
-            )
+        st.markdown("### 🔍 Filter & Sort")
         
-        with filter_col3:
-            # Sort options
-            sort_options = [
-                ("artist_name", "Artist Name"),
-                ("content_angle", "Content Angle"),
-                ("data_quality_score", "Quality Score"),
-                ("generated_at", "Generation Time")
-            ]
+        # Filter options and the columnar frame only change with the content
+        # list itself; the cache holds the list so an identity check can't
+        # match a recycled object
+        options_cache = st.session_state.get('_content_filter_options')
+        if options_cache is None or options_cache['content'] is not content_data:
+            frame = pd.DataFrame({
+                'artist_name': [item.get('artist_name', 'Unknown') for item in content_data],
+                'content_angle': [item.get('content_angle', 'unknown') for item in content_data],
+                'data_quality_score': [item.get('data_quality_score') for item in content_data],
+                'generated_at': [item.get('generated_at', '') for item in content_data]
+            })
+            options_cache = {
+                'content': content_data,
+                'frame': frame,
+                'artists': sorted(frame['artist_name'].unique()),
+                'angles': sorted(frame['content_angle'].unique())
+            }
+            st.session_state['_content_filter_options'] = options_cache
+        
+        # Batch filter and sort changes into one rerun on Apply instead of
+        # rerunning the whole page for every toggle
+        with st.form("content_filters"):
+            filter_col1, filter_col2, filter_col3 = st.columns(3)
+            
+            with filter_col1:
+                # Artist filter
+                all_artists = options_cache['artists']
+                selected_artists = st.multiselect(
+                    "Filter by Artist:",
+                    options=all_artists,
+                    default=all_artists,
+                    help="Select artists to display"
+                )
             
-            sort_by = st.selectbox(
-                "Sort by:",
-                options=[x[0] for x in sort_options],
-                format_func=lambda x: next(y[1] for y in sort_options if y[0] == x),
-                help="Choose sorting criteria"
-            )
+            with filter_col2:
+                # Content angle filter
+                all_angles = options_cache['angles']
+                selected_angles = st.multiselect(
+                    "Filter by Content Angle:",
+                    options=all_angles,
+                    default=all_angles,
+                    format_func=lambda x: x.replace('_', ' ').title(),
+                    help="Select content angles to display"
+                )
             
-            sort_desc = st.checkbox("Descending", value=True, help="Sort in descending order")
-        
-        # Apply filters
-        filtered_content = [
-            item for item in content_data
-            if item.get('artist_name', 'Unknown') in selected_artists
-            and item.get('content_angle', 'unknown') in selected_angles
-        ]
+            with filter_col3:
+                # Sort options
+                sort_options = [
+                    ("artist_name", "Artist Name"),
+                    ("content_angle", "Content Angle"),
+                    ("data_quality_score", "Quality Score"),
+                    ("generated_at", "Generation Time")
+                ]
+                
+                sort_by = st.selectbox(
+                    "Sort by:",
+                    options=[x[0] for x in sort_options],
+                    format_func=lambda x: next(y[1] for y in sort_options if y[0] == x),
+                    help="Choose sorting criteria"
+                )
+                
+                sort_desc = st.checkbox("Descending", value=True, help="Sort in descending order")
+            
+            st.form_submit_button("Apply")
         
-        # Apply sorting
-        if sort_by:
-            filtered_content = sorted(
-                filtered_content,
-                key=lambda x: x.get(sort_by, ''),
-                reverse=sort_desc
-            )
+        # Reuse the last filtered/sorted result while the inputs are unchanged
+        filter_inputs = (tuple(selected_artists), tuple(selected_angles), sort_by, sort_desc)
+        filter_cache = st.session_state.get('_filtered_content')
+        if filter_cache is not None and filter_cache['content'] is content_data and filter_cache['inputs'] == filter_inputs:
+            filtered_content = filter_cache['result']
+        else:
+            # Filter and sort on the frame, then map rows back to the records
+            # the card renderers expect
+            frame = options_cache['frame']
+            view = frame[frame['artist_name'].isin(selected_artists) & frame['content_angle'].isin(selected_angles)]
+            if sort_by:
+                view = view.sort_values(sort_by, ascending=not sort_desc, kind='stable')
+            filtered_content = [content_data[i] for i in view.index]
+            
+            st.session_state['_filtered_content'] = {
+                'content': content_data,
+                'inputs': filter_inputs,
+                'result': filtered_content
+            }
         
         st.info(f"Showing {len(filtered_content)} of {len(content_data)} content pieces")
         
         return filtered_content
     
-    def render_grid_view(self, content_data, items_per_row):
+    def render_grid_view(self, content_data, items_per_row, start=1):
         """Render content in grid layout"""
         st.markdown("### 🎨 Content Grid")
         
@@ -2075,21 +2595,21 @@ For Instagram/TikTok:
                     item = content_data[i + j]
                     
                     with col:
-                        self.render_content_card(item, i + j + 1)
+                        self.render_content_card(item, start + i + j)
     
-    def render_list_view(self, content_data):
+    def render_list_view(self, content_data, start=1):
         """Render content in list layout"""
         st.markdown("### 📋 Content List")
         
-        for i, item in enumerate(content_data, 1):
+        for i, item in enumerate(content_data, start):
             with st.expander(f"#{i} {item.get('artist_name', 'Unknown')} - {item.get('content_angle', 'unknown').replace('_', ' ').title()}", expanded=False):
                 self.render_content_details(item, i)
     
-    def render_card_view(self, content_data):
+    def render_card_view(self, content_data, start=1):
         """Render content in card layout"""
         st.markdown("### 🃏 Content Cards")
         
-        for i, item in enumerate(content_data, 1):
+        for i, item in enumerate(content_data, start):
             self.render_content_card(item, i, expanded=True)
             st.markdown("---")
     
@@ -2109,45 +2629,16 @@ For Instagram/TikTok:
         
         visual_container = st.container()
         with visual_container:
-            st.markdown(
-                f"""<div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    font-weight: bold;
-                    text-align: center;
-                    font-size: 18px;
-                    margin: 10px 0;
-                ">{visual_text}</div>""",
-                unsafe_allow_html=True
-            )
-        
-        # Copy button for visual text
-        if st.button(f"📋 Copy Visual Text", key=f"copy_visual_{index}", help="Copy visual text to clipboard"):
-            st.code(visual_text, language="text")
-            st.success("✅ Visual text ready to copy!")
+            st.markdown(f'<div class="visual-text-card large">{visual_text}</div>', unsafe_allow_html=True)
         
         # Caption container
         caption = item.get('caption', 'No caption')
         st.markdown("**📝 Caption:**")
         
-        st.markdown(
-            f"""<div style="
-                background: #f8f9ff;
-                border: 1px solid #e0e7ff;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 10px 0;
-                font-style: italic;
-            ">{caption}</div>""",
-            unsafe_allow_html=True
-        )
+        st.markdown(f'<div class="caption-card spaced">{caption}</div>', unsafe_allow_html=True)
         
-        # Copy button for caption
-        if st.button(f"📋 Copy Caption", key=f"copy_caption_{index}", help="Copy caption to clipboard"):
-            st.code(caption, language="text")
-            st.success("✅ Caption ready to copy!")
+        # Copy buttons for both texts, in one iframe
+        render_copy_buttons([("📋 Copy Visual Text", visual_text), ("📋 Copy Caption", caption)])
         
         # Metadata section
         if expanded:
@@ -2160,47 +2651,29 @@ For Instagram/TikTok:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("**🎨 Visual Text:**")
             visual_text = item.get('visual_text', 'No visual text')
             st.markdown(
-                f"""<div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 15px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    text-align: center;
-                ">{visual_text}</div>""",
+                f'**🎨 Visual Text:**\n\n<div class="visual-text-card">{visual_text}</div>',
                 unsafe_allow_html=True
             )
-            
-            if st.button(f"📋 Copy Visual", key=f"copy_visual_list_{index}"):
-                st.code(visual_text, language="text")
         
         with col2:
-            st.markdown("**📝 Caption:**")
             caption = item.get('caption', 'No caption')
             st.markdown(
-                f"""<div style="
-                    background: #f8f9ff;
-                    border: 1px solid #e0e7ff;
-                    padding: 15px;
-                    border-radius: 8px;
-                    font-style: italic;
-                ">{caption}</div>""",
+                f'**📝 Caption:**\n\n<div class="caption-card">{caption}</div>',
                 unsafe_allow_html=True
             )
-            
-            if st.button(f"📋 Copy Caption", key=f"copy_caption_list_{index}"):
-                st.code(caption, language="text")
         
         # Full content copy
         st.markdown("**📄 Full Content:**")
         full_content = f"Visual Text:\n{visual_text}\n\nCaption:\n{caption}"
         
-        if st.button(f"📋 Copy Both", key=f"copy_both_{index}", help="Copy both visual text and caption"):
-            st.code(full_content, language="text")
-            st.success("✅ Full content ready to copy!")
+        # All copy buttons for this item, in one iframe
+        render_copy_buttons([
+            ("📋 Copy Visual", visual_text),
+            ("📋 Copy Caption", caption),
+            ("📋 Copy Both", full_content)
+        ])
         
         # Metadata
         self.render_content_metadata(item)
@@ -2211,47 +2684,29 @@ For Instagram/TikTok:
         
         metadata_col1, metadata_col2 = st.columns(2)
         
+        # One text element per column instead of one per line
         with metadata_col1:
-            st.text(f"Event: {item.get('event_name', 'Unknown')}")
-            st.text(f"Platform: {item.get('platform', 'unknown').title()}")
-            st.text(f"Quality Score: {item.get('data_quality_score', 0):.1%}")
+            st.text(
+                f"Event: {item.get('event_name', 'Unknown')}\n"
+                f"Platform: {item.get('platform', 'unknown').title()}\n"
+                f"Quality Score: {item.get('data_quality_score', 0):.1%}"
+            )
         
         with metadata_col2:
             generated_at = item.get('generated_at', 'Unknown')
             if generated_at != 'Unknown':
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(generated_at.replace('Z', '+00:00'))
-                    st.text(f"Generated: {dt.strftime('%Y-%m-%d %H:%M')}")
-                except:
-                    st.text(f"Generated: {generated_at}")
+                generated_text = format_timestamp(generated_at, '%Y-%m-%d %H:%M', generated_at)
             else:
-                st.text("Generated: Unknown")
+                generated_text = "Unknown"
             
             # Priority score (calculated)
             priority_score = self.calculate_priority_score(item)
-            st.text(f"Priority Score: {priority_score}/10")
+            st.text(f"Generated: {generated_text}\nPriority Score: {priority_score}/10")
     
     def calculate_priority_score(self, item):
         """Calculate priority score based on content angle and quality"""
         base_score = item.get('data_quality_score', 0) * 5  # 0-5 points for quality
-        
-        angle_scores = {
-            'major_spike': 5,
-            'significant_spike': 4,
-            'genre_leader': 4,
-            'international_phenomenon': 4,
-            'tour_standout': 3,
-            'top_performer': 3,
-            'international_appeal': 2,
-            'pricing_surge': 2,
-            'notable_performance': 2,
-            'demand_indicator': 1,
-            'top_performance': 1,
-            'trending_event': 1
-        }
-        
-        angle_score = angle_scores.get(item.get('content_angle', 'trending_event'), 1)
+        angle_score = ANGLE_PRIORITY_SCORES.get(item.get('content_angle', 'trending_event'), 1)
         
         total_score = min(10, int(base_score + angle_score))
         return total_score
@@ -2275,7 +2730,7 @@ For Instagram/TikTok:
         
         with export_col1:
             st.markdown("**📄 JSON Export**")
-            json_data = self.prepare_json_export(content_data)
+            json_data = self.get_export_data(content_data, 'json')
             json_filename = f"social_content_export_{timestamp}.json"
             
             st.download_button(
@@ -2288,11 +2743,13 @@ For Instagram/TikTok:
             
             # Save to directory option
             if st.button("💾 Save JSON to Directory", key="save_json"):
-                self.save_to_directory(json_data, json_filename, 'json')
+                saved = self.save_to_directory(json_data, json_filename, 'json')
+                if saved:
+                    self.report_saved_exports([saved])
         
         with export_col2:
             st.markdown("**📊 CSV Export**")
-            csv_data = self.prepare_csv_export(content_data)
+            csv_data = self.get_export_data(content_data, 'csv')
             csv_filename = f"social_content_export_{timestamp}.csv"
             
             st.download_button(
@@ -2305,11 +2762,13 @@ For Instagram/TikTok:
             
             # Save to directory option
             if st.button("💾 Save CSV to Directory", key="save_csv"):
-                self.save_to_directory(csv_data, csv_filename, 'csv')
+                saved = self.save_to_directory(csv_data, csv_filename, 'csv')
+                if saved:
+                    self.report_saved_exports([saved])
         
         with export_col3:
             st.markdown("**📝 Text Export**")
-            text_data = self.prepare_text_export(content_data)
+            text_data = self.get_export_data(content_data, 'txt')
             text_filename = f"social_content_export_{timestamp}.txt"
             
             st.download_button(
@@ -2322,7 +2781,9 @@ For Instagram/TikTok:
             
             # Save to directory option
             if st.button("💾 Save Text to Directory", key="save_text"):
-                self.save_to_directory(text_data, text_filename, 'txt')
+                saved = self.save_to_directory(text_data, text_filename, 'txt')
+                if saved:
+                    self.report_saved_exports([saved])
         
         st.markdown("---")
         
@@ -2334,8 +2795,8 @@ For Instagram/TikTok:
             
             with original_col1:
                 st.markdown("**🔄 Original JSON**")
-                with open(output_files['json_file'], 'r') as f:
-                    original_json = f.read()
+                json_path = output_files['json_file']
+                original_json = read_file_bytes(json_path, os.path.getmtime(json_path))
                 
                 st.download_button(
                     label="📥 Download Original JSON",
@@ -2350,8 +2811,8 @@ For Instagram/TikTok:
             with original_col2:
                 if os.path.exists(output_files.get('text_file', '')):
                     st.markdown("**🔄 Original Text**")
-                    with open(output_files['text_file'], 'r') as f:
-                        original_text = f.read()
+                    text_path = output_files['text_file']
+                    original_text = read_file_bytes(text_path, os.path.getmtime(text_path))
                     
                     st.download_button(
                         label="📥 Download Original Text",
@@ -2388,24 +2849,54 @@ For Instagram/TikTok:
         # Show recent exports
         self.show_recent_exports()
     
-    def prepare_json_export(self, content_data):
+    def get_export_data(self, content_data, format_type):
+        """Serialize an export format once per content list, stamped with the current time"""
+        # Same identity check as the filter cache: hold the list so a recycled
+        # object can't match, and drop every format when the content changes
+        export_cache = st.session_state.get('_export_cache')
+        if export_cache is None or export_cache['content'] is not content_data:
+            export_cache = {'content': content_data, 'exports': {}}
+            st.session_state['_export_cache'] = export_cache
+        
+        exports = export_cache['exports']
+        if format_type not in exports:
+            if format_type == 'json':
+                exports[format_type] = self.prepare_json_export(content_data, EXPORT_TIMESTAMP_PLACEHOLDER)
+            elif format_type == 'csv':
+                exports[format_type] = self.prepare_csv_export(content_data)
+            else:
+                exports[format_type] = self.prepare_text_export(content_data, EXPORT_TIMESTAMP_PLACEHOLDER)
+        
+        # The export time isn't cached; the placeholder sits in the header
+        # ahead of any content, so only the first occurrence is replaced
+        if format_type == 'json':
+            return exports[format_type].replace(EXPORT_TIMESTAMP_PLACEHOLDER, datetime.now().isoformat(), 1)
+        if format_type == 'txt':
+            return exports[format_type].replace(
+                EXPORT_TIMESTAMP_PLACEHOLDER, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 1
+            )
+        return exports[format_type]
+    
+    def prepare_json_export(self, content_data, exported_at=None):
         """Prepare JSON export with metadata"""
+        summary = summarize_content(content_data)
+        priority_distribution, angle_distribution = self.calculate_distributions(content_data)
         export_data = {
             'metadata': {
-                'exported_at': datetime.now().isoformat(),
+                'exported_at': exported_at or datetime.now().isoformat(),
                 'total_content_pieces': len(content_data),
-                'unique_events': len(set(item.get('event_id', '') for item in content_data)),
-                'unique_artists': len(set(item.get('artist_name', '') for item in content_data)),
-                'content_angles': list(set(item.get('content_angle', '') for item in content_data)),
-                'platforms': list(set(item.get('platform', '') for item in content_data)),
+                'unique_events': summary['unique_events'],
+                'unique_artists': summary['unique_artists'],
+                'content_angles': summary['content_angles'],
+                'platforms': summary['platforms'],
                 'export_version': '1.0',
                 'source': 'Social Content Generator'
             },
             'content': content_data,
             'summary': {
-                'average_quality_score': sum(item.get('data_quality_score', 0) for item in content_data) / len(content_data) if content_data else 0,
-                'priority_distribution': self.calculate_priority_distribution(content_data),
-                'angle_distribution': self.calculate_angle_distribution(content_data)
+                'average_quality_score': summary['average_quality_score'],
+                'priority_distribution': priority_distribution,
+                'angle_distribution': angle_distribution
             }
         }
         
@@ -2413,88 +2904,64 @@ For Instagram/TikTok:
     
     def prepare_csv_export(self, content_data):
         """Prepare CSV export with flattened data"""
-        import csv
-        import io
-        
-        output = io.StringIO()
-        
-        # Define CSV headers
-        headers = [
-            'Index',
-            'Artist_Name',
-            'Event_Name', 
-            'Content_Angle',
-            'Platform',
-            'Visual_Text',
-            'Caption',
-            'Priority_Score',
-            'Quality_Score',
-            'Generated_At',
-            'Event_ID',
-            'Event_City',
-            'Event_Country',
-            'Event_Genre',
-            'Event_Rank'
-        ]
-        
-        writer = csv.writer(output)
-        writer.writerow(headers)
-        
-        for i, item in enumerate(content_data, 1):
-            event_data = item.get('event_data', {})
-            
-            row = [
-                i,
-                item.get('artist_name', 'Unknown'),
-                item.get('event_name', 'Unknown'),
-                item.get('content_angle', 'unknown').replace('_', ' ').title(),
-                item.get('platform', 'unknown').title(),
-                item.get('visual_text', '').replace('\n', ' | '),  # Replace newlines for CSV
-                item.get('caption', '').replace('\n', ' | '),
-                self.calculate_priority_score(item),
-                f"{item.get('data_quality_score', 0):.1%}",
-                item.get('generated_at', 'Unknown'),
-                item.get('event_id', 'Unknown'),
-                event_data.get('venue_city', 'Unknown'),
-                event_data.get('venue_country', 'Unknown'),
-                event_data.get('genre', 'Unknown'),
-                event_data.get('rank', 'Unknown')
-            ]
-            
-            writer.writerow(row)
-        
-        return output.getvalue()
+        # Gather each column as object dtype with the same .get defaults as a
+        # per-row writer; a DataFrame built from the dicts would turn ints into
+        # floats wherever a key is missing and can't tell missing from None
+        event_data = [item.get('event_data', {}) for item in content_data]
+        
+        def column(records, key, default):
+            return pd.Series([record.get(key, default) for record in records], dtype=object)
+        
+        # Flatten into the export columns with vectorized string ops
+        export_df = pd.DataFrame({
+            'Index': range(1, len(content_data) + 1),
+            'Artist_Name': column(content_data, 'artist_name', 'Unknown'),
+            'Event_Name': column(content_data, 'event_name', 'Unknown'),
+            'Content_Angle': column(content_data, 'content_angle', 'unknown').map(format_angle_name),
+            'Platform': column(content_data, 'platform', 'unknown').str.title(),
+            'Visual_Text': column(content_data, 'visual_text', '').str.replace('\n', ' | ', regex=False),  # Replace newlines for CSV
+            'Caption': column(content_data, 'caption', '').str.replace('\n', ' | ', regex=False),
+            'Priority_Score': calculate_priority_scores(content_data),
+            'Quality_Score': column(content_data, 'data_quality_score', 0).map('{:.1%}'.format),
+            'Generated_At': column(content_data, 'generated_at', 'Unknown'),
+            'Event_ID': column(content_data, 'event_id', 'Unknown'),
+            'Event_City': column(event_data, 'venue_city', 'Unknown'),
+            'Event_Country': column(event_data, 'venue_country', 'Unknown'),
+            'Event_Genre': column(event_data, 'genre', 'Unknown'),
+            'Event_Rank': column(event_data, 'rank', 'Unknown')
+        })
+        
+        # Match csv.writer's default line endings
+        return export_df.to_csv(index=False, lineterminator='\r\n')
     
-    def prepare_text_export(self, content_data):
+    def prepare_text_export(self, content_data, exported_at=None):
         """Prepare human-readable text export"""
         output = []
         
         # Header
         output.append("🎵 SOCIAL MEDIA CONTENT EXPORT")
         output.append("=" * 60)
-        output.append(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        output.append(f"Exported: {exported_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         output.append(f"Total Pieces: {len(content_data)}")
-        output.append(f"Unique Events: {len(set(item.get('event_id', '') for item in content_data))}")
+        output.append(f"Unique Events: {summarize_content(content_data)['unique_events']}")
         output.append("")
         
-        # Group by artist
-        content_by_artist = {}
-        for item in content_data:
-            artist = item.get('artist_name', 'Unknown')
-            if artist not in content_by_artist:
-                content_by_artist[artist] = []
-            content_by_artist[artist].append(item)
+        # Group by artist with a sorted groupby; the frame index points back
+        # into content_data
+        content_df = pd.DataFrame(content_data, columns=['artist_name'])
+        content_df['artist_name'] = content_df['artist_name'].fillna('Unknown')
+        content_df['priority'] = calculate_priority_scores(content_data)
         
         # Content sections
-        for artist, items in sorted(content_by_artist.items()):
+        for artist, group in content_df.groupby('artist_name', sort=True):
             output.append(f"🎭 {artist.upper()}")
             output.append("-" * 40)
             output.append("")
             
-            for i, item in enumerate(items, 1):
+            for i, (position, priority) in enumerate(zip(group.index, group['priority']), 1):
+                item = content_data[position]
                 angle = item.get('content_angle', 'unknown').replace('_', ' ').title()
                 platform = item.get('platform', 'unknown').title()
-                priority = self.calculate_priority_score(item)
                 
                 output.append(f"[{i}] {angle} • {platform} • Priority: {priority}/10")
                 output.append("")
@@ -2520,40 +2987,59 @@ For Instagram/TikTok:
         return "\n".join(output)
     
     def save_to_directory(self, data, filename, file_type):
-        """Save export data to the generated_content directory"""
+        """Save export data to the generated_content directory; returns (file_type, path, size) or None"""
         try:
-            # Ensure directory exists
-            os.makedirs("data/generated_content", exist_ok=True)
-            
-            # Full file path
-            file_path = os.path.join("data/generated_content", filename)
-            
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(data)
-            
-            st.success(f"✅ {file_type.upper()} saved to: `{file_path}`")
-            st.info(f"📁 File size: {len(data.encode('utf-8')) / 1024:.1f} KB")
-            
+            file_path, size = write_export_file(data, filename)
         except Exception as e:
             st.error(f"❌ Failed to save {file_type.upper()}: {str(e)}")
+            return None
+        
+        list_recent_content_files.clear()
+        scan_content_files.clear()
+        return file_type, file_path, size
+    
+    def report_saved_exports(self, saved, headline=None):
+        """Show every saved export in a single success message"""
+        lines = [
+            f"✅ {file_type.upper()} saved to: `{file_path}` ({size / 1024:.1f} KB)"
+            for file_type, file_path, size in saved
+        ]
+        if headline:
+            lines.insert(0, headline)
+        if lines:
+            st.success("  \n".join(lines))
     
     def export_all_formats(self, content_data, timestamp):
         """Export all formats at once"""
         try:
-            # Prepare all exports
-            json_data = self.prepare_json_export(content_data)
-            csv_data = self.prepare_csv_export(content_data)
-            text_data = self.prepare_text_export(content_data)
-            
-            # Save all files
+            # Prepare all exports on this thread; get_export_data reads session_state
             base_name = f"social_content_export_{timestamp}"
+            exports = {
+                file_type: self.get_export_data(content_data, file_type)
+                for file_type in ('json', 'csv', 'txt')
+            }
+            
+            # The three files are independent, so write them concurrently;
+            # results are reported here since workers can't call st.*
+            with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                futures = {
+                    file_type: executor.submit(write_export_file, data, f"{base_name}.{file_type}")
+                    for file_type, data in exports.items()
+                }
+            list_recent_content_files.clear()
+            scan_content_files.clear()
             
-            self.save_to_directory(json_data, f"{base_name}.json", 'json')
-            self.save_to_directory(csv_data, f"{base_name}.csv", 'csv')
-            self.save_to_directory(text_data, f"{base_name}.txt", 'txt')
+            saved = []
+            for file_type, future in futures.items():
+                try:
+                    saved.append((file_type, *future.result()))
+                except Exception as e:
+                    st.error(f"❌ Failed to save {file_type.upper()}: {str(e)}")
             
-            st.success("🎉 All formats exported successfully!")
+            self.report_saved_exports(
+                saved,
+                "🎉 All formats exported successfully!" if len(saved) == len(futures) else None
+            )
             
         except Exception as e:
             st.error(f"❌ Bulk export failed: {str(e)}")
@@ -2562,71 +3048,52 @@ For Instagram/TikTok:
         """Export only selected formats"""
         try:
             base_name = f"social_content_export_{timestamp}"
-            exported = []
+            saved = []
             
             for format_type in selected_formats:
-                if format_type == 'JSON':
-                    data = self.prepare_json_export(content_data)
-                    self.save_to_directory(data, f"{base_name}.json", 'json')
-                    exported.append('JSON')
-                
-                elif format_type == 'CSV':
-                    data = self.prepare_csv_export(content_data)
-                    self.save_to_directory(data, f"{base_name}.csv", 'csv')
-                    exported.append('CSV')
-                
-                elif format_type == 'TXT':
-                    data = self.prepare_text_export(content_data)
-                    self.save_to_directory(data, f"{base_name}.txt", 'txt')
-                    exported.append('TXT')
-            
-            st.success(f"✅ Exported formats: {', '.join(exported)}")
+                file_type = format_type.lower()
+                if file_type in ('json', 'csv', 'txt'):
+                    data = self.get_export_data(content_data, file_type)
+                    result = self.save_to_directory(data, f"{base_name}.{file_type}", file_type)
+                    if result:
+                        saved.append(result)
+            
+            self.report_saved_exports(
+                saved,
+                f"✅ Exported formats: {', '.join(file_type.upper() for file_type, _, _ in saved)}" if saved else None
+            )
             
         except Exception as e:
             st.error(f"❌ Selected export failed: {str(e)}")
     
-    def calculate_priority_distribution(self, content_data):
-        """Calculate priority score distribution"""
-        distribution = {}
-        for item in content_data:
-            score = self.calculate_priority_score(item)
-            distribution[score] = distribution.get(score, 0) + 1
-        return distribution
-    
-    def calculate_angle_distribution(self, content_data):
-        """Calculate content angle distribution"""
-        distribution = {}
-        for item in content_data:
-            angle = item.get('content_angle', 'unknown')
-            distribution[angle] = distribution.get(angle, 0) + 1
-        return distribution
+    def calculate_distributions(self, content_data):
+        """Calculate priority score and content angle distributions together"""
+        priority_distribution = Counter(calculate_priority_scores(content_data))
+        angle_distribution = Counter(item.get('content_angle', 'unknown') for item in content_data)
+        return dict(priority_distribution), dict(angle_distribution)
     
     def show_recent_exports(self):
         """Show recently exported files"""
         st.markdown("### 📋 Recent Exports")
         
-        if os.path.exists("data/generated_content"):
-            files = [f for f in os.listdir("data/generated_content") 
-                    if f.startswith('social_content_export_') and f.endswith(('.json', '.csv', '.txt'))]
-            
-            if files:
-                # Group by timestamp
-                export_groups = {}
-                for file in files:
-                    # Extract timestamp
-                    parts = file.split('_')
-                    if len(parts) >= 4:
-                        timestamp = f"{parts[2]}_{parts[3].split('.')[0]}"
-                        if timestamp not in export_groups:
-                            export_groups[timestamp] = []
-                        export_groups[timestamp].append(file)
-                
+        file_stats = scan_content_dir()
+        if file_stats is not None:
+            
+            # Filter and group exports by timestamp in one pass
+            export_groups = defaultdict(list)
+            for file in file_stats:
+                match = CONTENT_FILE_RE.match(file)
+                if match and match['export']:
+                    export_groups[match['timestamp']].append(file)
+            
+            if export_groups:
                 # Show recent exports (last 5)
-                for timestamp in sorted(export_groups.keys(), reverse=True)[:5]:
+                for timestamp in heapq.nlargest(5, export_groups):
                     with st.expander(f"📅 Exported: {timestamp}", expanded=False):
                         for file in sorted(export_groups[timestamp]):
-                            file_path = os.path.join("data/generated_content", file)
-                            file_size = os.path.getsize(file_path) / 1024
+                            file_path = os.path.join(CONTENT_DIR, file)
+                            file_size, file_mtime = file_stats[file]
+                            file_size /= 1024
                             
                             col1, col2, col3 = st.columns([2, 1, 1])
                             
@@ -2637,22 +3104,13 @@ For Instagram/TikTok:
                                 st.text(f"{file_size:.1f} KB")
                             
                             with col3:
-                                # Download button for each export
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    file_content = f.read()
-                                
-                                if file.endswith('.json'):
-                                    mime_type = "application/json"
-                                elif file.endswith('.csv'):
-                                    mime_type = "text/csv"
-                                else:
-                                    mime_type = "text/plain"
-                                
+                                # Download button for each export; bytes come from
+                                # the mtime-keyed cache, so reruns don't re-read disk
                                 st.download_button(
                                     label="📥",
-                                    data=file_content,
+                                    data=read_file_bytes(file_path, file_mtime),
                                     file_name=file,
-                                    mime=mime_type,
+                                    mime=EXPORT_MIME_TYPES.get(os.path.splitext(file)[1], "text/plain"),
                                     key=f"download_export_{file}"
                                 )
             else:
@@ -2665,25 +3123,23 @@ For Instagram/TikTok:
         st.markdown("---")
         st.markdown("### 📚 Available Files")
         
-        if os.path.exists("data/generated_content"):
-            files = [f for f in os.listdir("data/generated_content") if f.endswith(('.json', '.txt'))]
-            if files:
-                
-                # Group files by timestamp
-                file_groups = {}
-                for file in files:
-                    # Extract timestamp from filename
-                    if 'social_content_' in file:
-                        timestamp = file.replace('social_content_', '').split('.')[0]
-                        if timestamp not in file_groups:
-                            file_groups[timestamp] = []
-                        file_groups[timestamp].append(file)
-                
+        file_stats = scan_content_dir()
+        if file_stats is not None:
+            
+            # Filter and group JSON/text files by timestamp in one pass
+            file_groups = defaultdict(list)
+            for file in file_stats:
+                match = CONTENT_FILE_RE.match(file)
+                if match and match['ext'] != 'csv':
+                    file_groups[(match['export'] or '') + match['timestamp']].append(file)
+            
+            if file_groups:
                 for timestamp, group_files in sorted(file_groups.items(), reverse=True):
                     with st.expander(f"📅 Generated on {timestamp}", expanded=False):
                         for file in sorted(group_files):
-                            file_path = os.path.join("data/generated_content", file)
-                            file_size = os.path.getsize(file_path) / 1024  # KB
+                            file_path = os.path.join(CONTENT_DIR, file)
+                            file_size, file_mtime = file_stats[file]
+                            file_size /= 1024  # KB
                             
                             col1, col2, col3 = st.columns([2, 1, 1])
                             
@@ -2696,9 +3152,9 @@ For Instagram/TikTok:
                             with col3:
                                 if file.endswith('.json'):
                                     if st.button(f"👁️ View", key=f"view_{file}"):
-                                        # Load and display this file's content
-                                        with open(file_path, 'r') as f:
-                                            json_data = json.load(f)
+                                        # Load and display this file's content; the bytes
+                                        # come from the same cache as the download buttons
+                                        json_data = json.loads(read_file_bytes(file_path, file_mtime))
                                         
                                         st.session_state['latest_content'] = json_data.get('content', [])
                                         st.session_state['latest_output'] = {
@@ -2756,7 +3212,6 @@ For Instagram/TikTok:
                 # Show detailed error in expander for debugging
                 with st.expander("🔍 Error Details", expanded=False):
                     st.code(str(e))
-                    import traceback
                     st.code(traceback.format_exc())
         
         except Exception as e:
@@ -2812,7 +3267,6 @@ def main():
         
         # Show detailed error for debugging
         with st.expander("🔍 Full Error Traceback", expanded=False):
-            import traceback
             st.code(traceback.format_exc())
         
         # Recovery options
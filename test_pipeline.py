@@ -6,18 +6,63 @@ Run this to verify your setup and test the pipeline
 
 import os
 from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
 from dotenv import load_dotenv
 
+# Parse .env once; every check reads the same snapshot
+load_dotenv()
+ENV = MappingProxyType({
+    var: os.environ.get(var)
+    for var in (
+        'IS_LOCAL_DEV',
+        'SNOWFLAKE_ACCOUNT',
+        'SNOWFLAKE_USER',
+        'SNOWFLAKE_AUTHENTICATOR',
+        'SNOWFLAKE_WAREHOUSE',
+        'SNOWFLAKE_DATABASE',
+        'SNOWFLAKE_SCHEMA',
+        'SNOWFLAKE_ROLE',
+        'OPENAI_API_KEY',
+        'OPENAI_MODEL'
+    )
+})
+
 # Files are now in root directory
+# Import once up front; failures are reported by the test that needs them
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    from data_processing import SnowflakeConnector
+    CONNECTOR_IMPORT_ERROR = None
+except ImportError as e:
+    SnowflakeConnector = None
+    CONNECTOR_IMPORT_ERROR = e
+
+try:
+    from social_content_generator import SocialContentPipeline
+    PIPELINE_IMPORT_ERROR = None
+except ImportError as e:
+    SocialContentPipeline = None
+    PIPELINE_IMPORT_ERROR = e
+
+# Event fields shown for the sample event
+SAMPLE_EVENT_FIELDS = itemgetter(
+    'classified_artist_name', 'event_name', 'venue_city', 'venue_country', 'rank', 'recent_7d_gms'
+)
+
+# Variables whose values are masked when printed
+SECRET_VARS = frozenset({'OPENAI_API_KEY', 'SNOWFLAKE_PASSWORD'})
 
 def check_environment():
     """Check if all required environment variables are set"""
     print("🔍 Checking environment configuration...")
     
-    load_dotenv()
-    
     # Check if running locally
-    is_local = os.getenv('IS_LOCAL_DEV', '') == '1'
+    is_local = ENV['IS_LOCAL_DEV'] == '1'
     print(f"  🏠 Running locally: {is_local}")
     
     if is_local:
@@ -35,16 +80,15 @@ def check_environment():
         # In Snowflake environment, only need OpenAI key
         required_vars = ['OPENAI_API_KEY']
     
-    missing_vars = []
+    env = {var: ENV[var] for var in required_vars}
+    missing_vars = [var for var, value in env.items() if not value]
     
-    for var in required_vars:
-        value = os.getenv(var)
+    for var, value in env.items():
         if not value:
-            missing_vars.append(var)
             print(f"  ❌ {var}: Not set")
         else:
             # Show first few chars for security
-            if 'KEY' in var or 'PASSWORD' in var:
+            if var in SECRET_VARS:
                 display_value = value[:4] + "..." if len(value) > 4 else "***"
             else:
                 display_value = value[:20] + "..." if len(value) > 20 else value
@@ -64,9 +108,12 @@ def test_snowflake_connection():
     """Test Snowflake connection and view access"""
     print("\n🔌 Testing Snowflake connection...")
     
+    if CONNECTOR_IMPORT_ERROR is not None:
+        print(f"❌ Import error: {CONNECTOR_IMPORT_ERROR}")
+        print("Make sure all required packages are installed")
+        return False
+    
     try:
-        from data_processing import SnowflakeConnector
-        
         connector = SnowflakeConnector()
         
         # Test basic connection
@@ -90,10 +137,6 @@ def test_snowflake_connection():
         connector.close_connection()
         return all_accessible
         
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("Make sure all required packages are installed")
-        return False
     except Exception as e:
         print(f"❌ Connection test failed: {e}")
         return False
@@ -102,24 +145,20 @@ def test_openai_connection():
     """Test OpenAI API connection"""
     print("\n🤖 Testing OpenAI API connection...")
     
+    if openai is None:
+        print("❌ OpenAI API test failed: the openai package is not installed")
+        return False
+    
     try:
-        import openai
+        client = openai.OpenAI(api_key=ENV['OPENAI_API_KEY'])
+        model = ENV['OPENAI_MODEL'] or 'gpt-4o'
         
-        client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # Metadata lookup instead of a completion: checks the key and model
+        # access without generating (or paying for) any tokens
+        client.models.retrieve(model)
         
-        # Simple test call
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": "Test message - please respond with 'API working'"}],
-            max_tokens=10
-        )
-        
-        if "API working" in response.choices[0].message.content:
-            print("✅ OpenAI API connection successful")
-            return True
-        else:
-            print("⚠️  OpenAI API responded but with unexpected content")
-            return True  # Still working, just different response
+        print(f"✅ OpenAI API connection successful (model: {model})")
+        return True
             
     except Exception as e:
         print(f"❌ OpenAI API test failed: {e}")
@@ -129,9 +168,11 @@ def run_sample_pipeline():
     """Run a small sample of the pipeline"""
     print("\n🚀 Running sample pipeline...")
     
+    if PIPELINE_IMPORT_ERROR is not None:
+        print(f"❌ Sample pipeline failed: {PIPELINE_IMPORT_ERROR}")
+        return False
+    
     try:
-        from social_content_generator import SocialContentPipeline
-        
         pipeline = SocialContentPipeline()
         
         # Query just the base events view for testing
@@ -153,12 +194,13 @@ def run_sample_pipeline():
         
         # Show sample event data
         sample_event = events[0]
+        artist, event_name, city, country, rank, recent_gms = SAMPLE_EVENT_FIELDS(sample_event)
         print(f"\n📋 Sample event data:")
-        print(f"  Artist: {sample_event['classified_artist_name']}")
-        print(f"  Event: {sample_event['event_name']}")
-        print(f"  Location: {sample_event['venue_city']}, {sample_event['venue_country']}")
-        print(f"  Rank: #{sample_event['rank']}")
-        print(f"  Recent GMS: ${sample_event['recent_7d_gms']:,.0f}")
+        print(f"  Artist: {artist}")
+        print(f"  Event: {event_name}")
+        print(f"  Location: {city}, {country}")
+        print(f"  Rank: #{rank}")
+        print(f"  Recent GMS: ${recent_gms:,.0f}")
         print(f"  Data completeness: {sample_event['data_completeness']['completeness_score']:.1%}")
         
         # Identify content angles
@@ -176,9 +218,11 @@ def generate_test_content():
     """Generate one piece of test content"""
     print("\n✍️  Generating test content...")
     
+    if PIPELINE_IMPORT_ERROR is not None:
+        print(f"❌ Test content generation failed: {PIPELINE_IMPORT_ERROR}")
+        return False
+    
     try:
-        from social_content_generator import SocialContentPipeline
-        
         pipeline = SocialContentPipeline()
         
         # Get data
@@ -215,6 +259,14 @@ def generate_test_content():
         print(f"❌ Test content generation failed: {e}")
         return False
 
+def run_test(test_name, test_func):
+    """Run one check, treating an unexpected exception as a failure"""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"❌ {test_name} failed with exception: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🧪 Social Media Content Pipeline - Setup Test")
@@ -232,11 +284,7 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results[test_name] = False
+        results[test_name] = run_test(test_name, test_func)
     
     # Summary
     print(f"\n{'='*50}")
@@ -0,0 +1,36 @@
+"""Tests for the Streamlit app's content export helpers"""
+
+import pytest
+
+# streamlit_app pulls in the Snowflake connector through data_processing
+pytest.importorskip("snowflake")
+
+from streamlit_app import SocialContentApp
+
+
+def make_item(event_id, rank=None):
+    """Build a minimal generated content item"""
+    event_data = {'venue_city': 'Austin', 'venue_country': 'US', 'genre': 'pop'}
+    if rank is not None:
+        event_data['rank'] = rank
+    return {
+        'event_id': event_id,
+        'artist_name': 'Artist',
+        'event_name': 'Event',
+        'content_angle': 'genre_leader',
+        'platform': 'tiktok',
+        'visual_text': 'Line one\nLine two',
+        'caption': 'Caption',
+        'data_quality_score': 0.8,
+        'generated_at': '2025-01-01T12:00:00',
+        'event_data': event_data
+    }
+
+
+def test_csv_export_keeps_integer_rank_when_one_item_has_no_rank():
+    app = object.__new__(SocialContentApp)
+    rows = app.prepare_csv_export([make_item(1, rank=3), make_item(2)]).split('\r\n')
+
+    assert rows[1].endswith(',1,Austin,US,pop,3')
+    assert rows[2].endswith(',2,Austin,US,pop,Unknown')
+    assert 'Line one | Line two' in rows[1]